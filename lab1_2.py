@@ -16,7 +16,7 @@ def f(x):
     # if abs(math.sin(x)) < 1e-3:  # пропускаємо точки де функція не визначена
     #     return None
     #  return 1 / math.tan(x) - (1 / x - x / 2)
-    return math.cos(x) - x
+    return cos(x) - x
 
     # if abs(math.sin(x)) < 1e-2 or abs(x) < 1e-3:
     #     return None
@@ -26,58 +26,623 @@ def f(x):
     #     return None
 
 
+# Векторизована версія f (NaN там, де функція не визначена)
+def f_vec(x):
+    x = np.asarray(x, dtype=float)
+    return np.cos(x) - x
+
+
+# Пошук відрізків з коренями на сітці з адаптивним уточненням
+def find_brackets(fv, a, b, n=None, depth=6, split=8):
+    """
+    fv — векторизована функція (NaN у точках, де f не визначена).
+    Сітка обчислюється одним викликом fv, далі дробляться лише клітинки
+    зі зміною знаку, біля полюсів і там, де можлива пара близьких коренів.
+    Повертає масив відрізків форми (k, 2), кожен з яких містить один корінь.
+    """
+    if n is None:
+        n = int(max(1000, 100 * (b - a)))
+    X = np.linspace(a, b, n + 1)[None, :]
+    Y = np.asarray(fv(X), dtype=float)
+    scale = np.full(1, np.inf)
+    found = []
+
+    for level in range(depth + 1):
+        yl, yr = Y[:, :-1], Y[:, 1:]
+        fl, fr = np.isfinite(yl), np.isfinite(yr)
+        fin = fl & fr
+        change = fin & ((yl == 0) | (yl * yr < 0) | ((yr == 0) & (X[:, 1:] == b)))
+        if level == depth:
+            break
+
+        # можлива пара коренів: локальний мінімум |f| близько до нуля
+        ay = np.abs(Y)
+        d = np.diff(ay, axis=1)
+        d_left = np.hstack((-np.abs(d[:, :1]), d))
+        d_right = np.hstack((d, np.abs(d[:, -1:])))
+        dip = (d_left <= 0) & (d_right >= 0) & (ay < np.maximum(np.abs(d_left), np.abs(d_right)))
+        # стрибок проти напрямку сусідніх клітинок — ознака полюса всередині
+        s = np.sign(np.diff(Y, axis=1))
+        s_prev = np.hstack((-s[:, :1], s[:, :-1]))
+        s_next = np.hstack((s[:, 1:], -s[:, -1:]))
+        spike = (s_prev == s_next) & (s != s_prev)
+        suspect = (fl ^ fr) | (fin & ~change & ((dip[:, :-1] | dip[:, 1:]) | spike))
+
+        refine = change | suspect
+        if not refine.any():
+            break
+
+        r, c = np.nonzero(refine)
+        t = np.linspace(0, 1, split + 1)
+        xs = X[r, c][:, None] + (X[r, c + 1] - X[r, c])[:, None] * t
+        ys = np.empty_like(xs)
+        ys[:, 0], ys[:, -1] = Y[r, c], Y[r, c + 1]
+        ys[:, 1:-1] = fv(xs[:, 1:-1])
+
+        # клітинка підтверджена, якщо f на ній скінченна й монотонна
+        dy = np.diff(ys, axis=1)
+        mono = np.isfinite(ys).all(axis=1) & ((dy > 0).all(axis=1) | (dy < 0).all(axis=1))
+        confirmed = change[r, c] & mono
+        found.append(xs[confirmed][:, [0, -1]])
+
+        keep = ~confirmed
+        cell_scale = np.maximum(np.abs(Y[r, c]), np.abs(Y[r, c + 1]))
+        scale = np.fmin(scale[r], cell_scale)[keep]
+        X, Y = xs[keep], ys[keep]
+        if not len(X):
+            break
+
+    # непідтверджені клітинки: корінь, якщо |f| не зростає при дробленні (інакше полюс)
+    if len(X):
+        r, c = np.nonzero(change)
+        root = np.maximum(np.abs(Y[r, c]), np.abs(Y[r, c + 1])) <= scale[r]
+        found.append(np.column_stack((X[r, c], X[r, c + 1]))[root])
+
+    brackets = np.vstack(found) if found else np.empty((0, 2))
+    return brackets[np.argsort(brackets[:, 0])]
+
+
+# Усі корені на [a, b] через кусково-чебишовську апроксимацію f
+def chebyshev_roots(fv, a, b, tol=1e-13, max_deg=128, min_width=1e-9, polish=2):
+    """
+    fv — векторизована функція. [a, b] ділиться, доки на кожній частині
+    інтерполянт Чебишова степеня ≤ max_deg не збіжиться. Частина, де |f|
+    зросла порівняно з попередніми рівнями поділу (той самий тест, що у
+    find_brackets) і монотонно наростає до полюса без інших змін знаку,
+    відкидається одразу, а не ділиться до min_width. Області, де f не
+    визначена (NaN), вирізаються за скінченними значеннями; проміжок до такої
+    області уточнюється, лише якщо |f| до неї не зростає. Степінь не
+    підвищується, коли за швидкістю спадання коефіцієнтів tol до max_deg не
+    досягти. Корені кожного інтерполянта — власні числа
+    матриці-компаньйона (colleague matrix), далі кілька кроків Ньютона.
+    Знаходить і кратні корені без зміни знаку.
+    Повертає кортеж (відсортований масив коренів, кількість обчислень fv).
+    """
+    cheb = np.polynomial.chebyshev
+    # частина: (lo, hi, найменший max|f| серед попередніх рівнів поділу)
+    pieces = [(a, b, np.inf)]
+    roots = []
+    evals = 0
+    while pieces:
+        lo, hi, level = pieces.pop()
+        if hi - lo <= min_width:
+            continue
+        mid, half = (lo + hi) / 2, (hi - lo) / 2
+
+        # точки Чебишова другого роду: при подвоєнні n старі значення зберігаються
+        n = 16
+        t = np.cos(np.pi * np.arange(n + 1) / n)
+        y = np.asarray(fv(mid + half * t), dtype=float)
+        evals += n + 1
+        coef = None
+        tail_prev = None
+        # різкий пік |f| — ймовірний полюс, ділимо одразу без підвищення степеня
+        spike = np.abs(y).max() > 1e4 * (np.median(np.abs(y)) + 1e-300)
+        while np.isfinite(y).all() and not spike:
+            ext = np.concatenate((y, y[-2:0:-1]))
+            c = np.real(np.fft.fft(ext))[:n + 1] / n
+            c[0] /= 2
+            c[-1] /= 2
+            scale = max(np.abs(y).max(), 1e-300)
+            tail = np.abs(c[-(n // 4):]).max()
+            # збіжність до tol або вихід хвоста на рівень шуму округлення
+            plateau = tail_prev is not None and 1e-8 * scale > tail > 0.25 * tail_prev
+            if tail <= tol * scale or plateau:
+                big = np.nonzero(np.abs(c) > max(tol * scale, 10 * tail * plateau))[0]
+                coef = c[:big[-1] + 1] if big.size else c[:1]
+                break
+            # за швидкістю спадання хвоста tol не досягти до max_deg (особливість
+            # поблизу) або f монотонна одного знаку — далі підвищувати степінь марно
+            slow = tail_prev is not None and tail * (tail / tail_prev) ** ((max_deg - n) / (n // 2)) > tol * scale
+            dy = np.diff(y)
+            if (slow or 2 * n > max_deg
+                    or (np.all(y > 0) or np.all(y < 0)) and (np.all(dy > 0) or np.all(dy < 0))):
+                break
+            tail_prev = tail
+            t_new = np.cos(np.pi * np.arange(1, 2 * n, 2) / (2 * n))
+            y_new = np.asarray(fv(mid + half * t_new), dtype=float)
+            evals += n
+            y2 = np.empty(2 * n + 1)
+            y2[::2], y2[1::2] = y, y_new
+            n, t, y = 2 * n, np.cos(np.pi * np.arange(2 * n + 1) / (2 * n)), y2
+
+        if coef is None:
+            # монотонна f одного знаку (наприклад, біля полюса) коренів не має
+            dy = np.diff(y)
+            finite = np.isfinite(y)
+            if finite.all() and (np.all(y > 0) or np.all(y < 0)) and (np.all(dy > 0) or np.all(dy < 0)):
+                continue
+            # вузли в порядку зростання x
+            xs, ys = mid + half * t[::-1], y[::-1]
+            if not finite.all():
+                # частина цілком у області, де f не визначена, відкидається
+                pieces += _finite_runs(xs, ys, level)
+                continue
+            i = np.argmax(np.abs(ys))
+            top = abs(ys[i])
+            # |f| зросла при подрібненні і лише наростає до піку — полюс, а не корінь
+            if top > level and _pole_only(ys, i):
+                continue
+            # ділимо в точці найбільшого |f| (ймовірний полюс) або навпіл
+            split = xs[i]
+            if not lo + 0.01 * (hi - lo) < split < hi - 0.01 * (hi - lo):
+                split = mid
+            level = min(level, top)
+            pieces += [(lo, split, level), (split, hi, level)]
+            continue
+        if len(coef) < 2:
+            continue
+
+        r = cheb.chebroots(coef)
+        r = r[(np.abs(r.imag) < 10 * np.sqrt(tol)) & (np.abs(r.real) <= 1 + 1e-10)].real
+        if not r.size:
+            continue
+        x = mid + half * np.clip(r, -1, 1)
+
+        # уточнення Ньютоном: значення з fv, похідна з інтерполянта
+        dcoef = cheb.chebder(coef) / half
+        for _ in range(polish):
+            fx = np.asarray(fv(x), dtype=float)
+            evals += x.size
+            dfx = cheb.chebval((x - mid) / half, dcoef)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                x_new = x - fx / dfx
+            x = np.where(np.isfinite(x_new) & (x_new >= lo) & (x_new <= hi), x_new, x)
+        roots.append(x)
+
+    if not roots:
+        return np.empty(0), evals
+    roots = np.sort(np.concatenate(roots))
+    # об'єднуємо дублікати (кратні корені, корені на межах частин)
+    keep = np.concatenate(([True], np.diff(roots) > 1e-7 * (1 + np.abs(roots[1:]))))
+    return roots[keep], evals
+
+
+# Чи схожа частина на полюс у вузлі i: |f| наростає до i з обох боків, а знак
+# змінюється хіба що поруч з i
+def _pole_only(y, i):
+    ay = np.abs(y)
+    if np.any(np.diff(ay[:i + 1]) < 0) or np.any(np.diff(ay[i:]) > 0):
+        return False
+    change = np.nonzero(np.sign(y[:-1]) != np.sign(y[1:]))[0]
+    return bool(np.all((change == i - 1) | (change == i)))
+
+
+# Частини між скінченними значеннями f (вузли xs за зростанням). Проміжок між
+# крайнім скінченним і першим невизначеним вузлом відкидається, якщо |f| до
+# нього зростає (полюс, закритий маскою), інакше уточнюється як окрема частина
+def _finite_runs(xs, ys, level):
+    finite = np.isfinite(ys)
+    edges = np.diff(np.concatenate(([0], finite.astype(np.int8), [0])))
+    pieces = []
+    for p, q in zip(np.nonzero(edges == 1)[0], np.nonzero(edges == -1)[0] - 1):
+        if q > p:
+            pieces.append((xs[p], xs[q], level))
+        for j, k, gap in ((q, q - 1, q + 1), (p, p + 1, p - 1)):
+            if not 0 <= gap < xs.size:
+                continue
+            if q > p and abs(ys[j]) > abs(ys[k]) and ys[j] * ys[k] > 0:
+                continue
+            pieces.append((min(xs[j], xs[gap]), max(xs[j], xs[gap]), level))
+    return pieces
+
+
+# Журнал ітерацій у попередньо виділеному структурованому масиві NumPy
+class IterationTrace:
+    """
+    fields — назви стовпців (дійсні числа), capacity — початковий розмір буфера.
+    last=N — зберігати лише останні N ітерацій (кільцевий буфер),
+    every=k — записувати лише кожну k-ту ітерацію.
+    """
+
+    def __init__(self, fields, capacity=256, last=None, every=1):
+        self.buffer = np.empty(last or capacity, dtype=[(name, float) for name in fields])
+        self.last = last
+        self.every = every
+        self.count = 0  # скільки рядків записано
+        self.step = 0   # скільки ітерацій побачено
+
+    def record(self, *values):
+        step = self.step
+        self.step += 1
+        if step % self.every:
+            return
+        if self.last:
+            self.buffer[self.count % self.last] = values
+        else:
+            if self.count == len(self.buffer):
+                self.buffer = np.resize(self.buffer, 2 * len(self.buffer))
+            self.buffer[self.count] = values
+        self.count += 1
+
+    # записані рядки в хронологічному порядку
+    def rows(self):
+        if not self.last or self.count <= self.last:
+            return self.buffer[:self.count]
+        i = self.count % self.last
+        return np.concatenate((self.buffer[i:], self.buffer[:i]))
+
+    def __len__(self):
+        return min(self.count, self.last) if self.last else self.count
+
+
+# trace=None — повний журнал, False — без журналу, IterationTrace — як задано
+def _make_trace(trace, fields):
+    if trace is None:
+        return IterationTrace(fields)
+    return None if trace is False else trace
+
 
 # Метод бісекції
-def bisection(a, b, eps):
-    results = []
+def bisection(a, b, eps, trace=None):
+    rec = _make_trace(trace, ("a", "b", "c", "fc"))
     if f(a) * f(b) > 0:
         return None, []
     while abs(b - a) > eps:
         c = (a + b) / 2
-        results.append((a, b, c, f(c)))
-        if f(a) * f(c) < 0:
+        fc = f(c)
+        if rec is not None:
+            rec.record(a, b, c, fc)
+        if f(a) * fc < 0:
             b = c
         else:
             a = c
     x_root = (a + b) / 2
-    return x_root, results
+    return x_root, rec.rows() if rec is not None else []
+
+
+# Метод Брента (обернена квадратична інтерполяція, січні, бісекція)
+def brent_method(a, b, eps, max_iter=100, func=None, trace=None):
+    """
+    Одне обчислення f на ітерацію, корінь завжди залишається у відрізку.
+    Повертає кортеж (корінь або None, журнал ітерацій (a, b, c, f(c))).
+    """
+    func = func or f
+    rec = _make_trace(trace, ("a", "b", "c", "fc"))
+    fa, fb = func(a), func(b)
+    if fa is None or fb is None or fa * fb > 0:
+        return None, []
+    c, fc = b, fb
+    d = e = b - a
+    for _ in range(max_iter):
+        # c — протилежний кінець відрізка, b — найкраще наближення
+        if fb * fc > 0:
+            c, fc = a, fa
+            d = e = b - a
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+        tol = 2 * np.finfo(float).eps * abs(b) + eps / 2
+        m = (c - b) / 2
+        if abs(m) <= tol or fb == 0:
+            return b, rec.rows() if rec is not None else []
+
+        if abs(e) >= tol and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                # метод січних
+                p, q = 2 * m * s, 1 - s
+            else:
+                # обернена квадратична інтерполяція
+                q, r = fa / fc, fb / fc
+                p = s * (2 * m * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+            if 2 * p < min(3 * m * q - abs(tol * q), abs(e * q)):
+                e, d = d, p / q
+            else:
+                d = e = m
+        else:
+            d = e = m
+
+        a, fa = b, fb
+        b += d if abs(d) > tol else math.copysign(tol, m)
+        fb = func(b)
+        if fb is None:
+            return None, rec.rows() if rec is not None else []
+        if rec is not None:
+            rec.record(min(a, c), max(a, c), b, fb)
+    return b, rec.rows() if rec is not None else []
+
+
+# Пакетне уточнення коренів на багатьох відрізках одночасно
+def batch_roots(fv, a, b, eps, max_iter=200, method="illinois"):
+    """
+    a, b — масиви кінців відрізків, fv — векторизована функція.
+    Крок бісекції або Іллінойса виконується одразу для всіх відрізків,
+    кожен відрізок має власну ознаку збіжності.
+    Повертає кортеж (масив коренів, масив кількості ітерацій);
+    для відрізків без зміни знаку корінь дорівнює NaN.
+    """
+    a = np.array(a, dtype=float)
+    b = np.array(b, dtype=float)
+    fa, fb = np.asarray(fv(a), dtype=float), np.asarray(fv(b), dtype=float)
+    roots = np.full(a.shape, np.nan)
+    iters = np.zeros(a.shape, dtype=int)
+
+    roots[fb == 0] = b[fb == 0]
+    roots[fa == 0] = a[fa == 0]
+    active = np.isfinite(fa) & np.isfinite(fb) & (fa * fb < 0)
+    scale = np.maximum(np.abs(fa), np.abs(fb))
+    side = np.zeros(a.shape, dtype=int)  # який кінець замінено востаннє
+    c_prev = np.full(a.shape, np.nan)
+
+    for _ in range(max_iter):
+        idx = np.nonzero(active)[0]
+        if not idx.size:
+            break
+        ai, bi, fai, fbi = a[idx], b[idx], fa[idx], fb[idx]
+        c = (ai + bi) / 2
+        if method == "illinois":
+            with np.errstate(divide="ignore", invalid="ignore"):
+                cf = (ai * fbi - bi * fai) / (fbi - fai)
+            c = np.where((cf > ai) & (cf < bi), cf, c)
+        fc = np.asarray(fv(c), dtype=float)
+        iters[idx] += 1
+
+        # корінь на [a, c] — замінюємо b, інакше — a
+        left = fai * fc < 0
+        si = side[idx]
+        if method == "illinois":
+            fai = np.where(left & (si == -1), fai / 2, fai)
+            fbi = np.where(~left & (si == 1), fbi / 2, fbi)
+        a[idx] = np.where(left, ai, c)
+        fa[idx] = np.where(left, fai, fc)
+        b[idx] = np.where(left, c, bi)
+        fb[idx] = np.where(left, fc, fbi)
+        side[idx] = np.where(left, -1, 1)
+
+        width = b[idx] - a[idx] <= eps
+        done = (fc == 0) | width | (np.abs(c - c_prev[idx]) <= eps / 2)
+        # якщо |f| зросла порівняно з кінцями відрізка, це полюс, а не корінь
+        pole = np.abs(fc) > scale[idx]
+        ok = done & ~pole
+        roots[idx] = np.where(ok, np.where(width, (a[idx] + b[idx]) / 2, c), np.nan)
+        c_prev[idx] = c
+        # NaN у середині відрізка — також полюс, такий відрізок відкидаємо
+        active[idx] = ~done & np.isfinite(fc)
+
+    # відрізки, що не зійшлися за max_iter, повертаємо за останнім наближенням
+    stalled = active & np.isnan(roots)
+    roots[stalled] = (a[stalled] + b[stalled]) / 2
+    return roots, iters
 
 
 # Метод простої ітерації
-def iteration_method(f, x0, eps=1e-6, max_iter=1000):
+def iteration_method(f, x0, eps=1e-6, max_iter=1000, accel=None, relax=False, patience=5,
+                     trace=None):
     """
     x_{n+1} = g(x_n), де g(x) = x + f(x) (можна змінити, залежно від рівняння)
-    Повертає кортеж (корінь або None, список ітерацій)
+    accel: None — звичайна ітерація, "aitken" — прискорення Δ² Ейткена,
+    "steffensen" — метод Стеффенсена.
+    relax=True — релаксація g(x) = x - λ·f(x), λ ≈ 1/f'(x0) за локальним нахилом.
+    Якщо різниці наближень не спадають patience кроків поспіль — розбіжність.
+    trace — журнал ітерацій (див. _make_trace).
+    Повертає кортеж (корінь або None, журнал ітерацій (x, x_next))
     """
-    results = []
+    rec = _make_trace(trace, ("x", "x_next"))
+    # g(x) = x + f(x) відповідає λ = -1 у релаксованій формі g(x) = x - λ·f(x)
+    lam = -1.0
+    if relax:
+        # λ ≈ 1 / f'(x0) за локальним нахилом, тоді g'(x0) ≈ 0
+        h = 1e-6 * max(1.0, abs(x0))
+        try:
+            slope = (f(x0 + h) - f(x0 - h)) / (2 * h)
+        except:
+            slope = 0
+        if slope:
+            lam = 1 / slope
+
+    def g(x):
+        return x - lam * f(x)
+
     x = x0
+    x_prev = None
+    a_prev = None  # попереднє прискорене наближення (Ейткен)
+    d_prev = None
+    growth = 0
     for i in range(max_iter):
-        # g(x) = x + f(x) (стандартний підхід для простої ітерації)
         try:
-            x_next = x + f(x)
+            if accel == "steffensen":
+                x1 = g(x)
+                x2 = g(x1)
+                denom = x2 - 2 * x1 + x
+                x_next = x - (x1 - x) ** 2 / denom if denom != 0 else x2
+            else:
+                x_next = g(x)
         except:
-            return None, results
-        results.append((x, x_next))
-        if abs(x_next - x) < eps:
-            return x_next, results
-        x = x_next
-    return None, results
+            return None, rec.rows() if rec is not None else []
+        if rec is not None:
+            rec.record(x, x_next)
+        d = abs(x_next - x)
+        if d < eps:
+            return x_next, rec.rows() if rec is not None else []
+
+        if accel == "aitken" and d_prev is not None and d < d_prev:
+            # Δ² Ейткена над трьома послідовними наближеннями (лише поки ітерації стискають)
+            denom = x_next - 2 * x + x_prev
+            if denom != 0:
+                a = x_prev - (x - x_prev) ** 2 / denom
+                if a_prev is not None and abs(a - a_prev) < eps:
+                    return a, rec.rows() if rec is not None else []
+                a_prev = a
+
+        # рання зупинка: різниці не спадають кілька кроків поспіль
+        growth = growth + 1 if d_prev is not None and d >= d_prev else 0
+        if growth >= patience or not math.isfinite(x_next):
+            return None, rec.rows() if rec is not None else []
+        d_prev = d
+        x_prev, x = x, x_next
+    return None, rec.rows() if rec is not None else []
+
+
+# Дуальне число value + deriv·ε (ε² = 0): f(Dual(x, 1)) дає одразу f(x) і f'(x)
+class Dual:
+    __slots__ = ("value", "deriv")
+
+    def __init__(self, value, deriv=0.0):
+        self.value = value
+        self.deriv = deriv
+
+    def __add__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value + other.value, self.deriv + other.deriv)
+        return Dual(self.value + other, self.deriv)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value - other.value, self.deriv - other.deriv)
+        return Dual(self.value - other, self.deriv)
+
+    def __rsub__(self, other):
+        return Dual(other - self.value, -self.deriv)
+
+    def __mul__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value * other.value,
+                        self.deriv * other.value + self.value * other.deriv)
+        return Dual(self.value * other, self.deriv * other)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Dual):
+            return Dual(self.value / other.value,
+                        (self.deriv * other.value - self.value * other.deriv) / other.value ** 2)
+        return Dual(self.value / other, self.deriv / other)
+
+    def __rtruediv__(self, other):
+        return Dual(other / self.value, -other * self.deriv / self.value ** 2)
+
+    def __pow__(self, n):
+        if isinstance(n, Dual):
+            return exp(n * log(self))
+        return Dual(self.value ** n, n * self.value ** (n - 1) * self.deriv)
+
+    def __rpow__(self, base):
+        value = base ** self.value
+        return Dual(value, value * math.log(base) * self.deriv)
+
+    def __neg__(self):
+        return Dual(-self.value, -self.deriv)
 
+    def __pos__(self):
+        return self
 
-def newton_method(x0, eps, max_iter=1000):
+    def __abs__(self):
+        return -self if self.value < 0 else self
+
+    # порівняння — лише за значенням
+    def __lt__(self, other):
+        return self.value < (other.value if isinstance(other, Dual) else other)
+
+    def __le__(self, other):
+        return self.value <= (other.value if isinstance(other, Dual) else other)
+
+    def __gt__(self, other):
+        return self.value > (other.value if isinstance(other, Dual) else other)
+
+    def __ge__(self, other):
+        return self.value >= (other.value if isinstance(other, Dual) else other)
+
+    def __repr__(self):
+        return f"Dual({self.value!r}, {self.deriv!r})"
+
+
+# елементарні функції, що приймають і числа, і дуальні числа
+def sin(x):
+    if isinstance(x, Dual):
+        return Dual(math.sin(x.value), math.cos(x.value) * x.deriv)
+    return math.sin(x)
+
+
+def cos(x):
+    if isinstance(x, Dual):
+        return Dual(math.cos(x.value), -math.sin(x.value) * x.deriv)
+    return math.cos(x)
+
+
+def tan(x):
+    if isinstance(x, Dual):
+        t = math.tan(x.value)
+        return Dual(t, (1 + t * t) * x.deriv)
+    return math.tan(x)
+
+
+def exp(x):
+    if isinstance(x, Dual):
+        e = math.exp(x.value)
+        return Dual(e, e * x.deriv)
+    return math.exp(x)
+
+
+def log(x):
+    if isinstance(x, Dual):
+        return Dual(math.log(x.value), x.deriv / x.value)
+    return math.log(x)
+
+
+def sqrt(x):
+    if isinstance(x, Dual):
+        r = math.sqrt(x.value)
+        return Dual(r, x.deriv / (2 * r))
+    return math.sqrt(x)
+
+
+def newton_method(x0, eps, max_iter=1000, derivative="dual"):
     """
     Метод Ньютона: x_{n+1} = x_n - f(x_n)/f'(x_n)
+    derivative="dual" — похідна через дуальні числа за одне обчислення f,
+    derivative="fd" (або якщо f не підтримує Dual) — центральні різниці.
     """
     def df(x):
         h = 1e-6  # малий крок для чисельної похідної
-        if f(x + h) is None or f(x - h) is None:
+        f_plus, f_minus = f(x + h), f(x - h)
+        if f_plus is None or f_minus is None:
             return None
-        return (f(x + h) - f(x - h)) / (2 * h)
+        return (f_plus - f_minus) / (2 * h)
+
+    def f_df(x):
+        if derivative == "dual":
+            try:
+                y = f(Dual(x, 1.0))
+            except TypeError:
+                y = None
+            if isinstance(y, Dual):
+                return y.value, y.deriv
+        # f не підтримує дуальні числа — рахуємо похідну різницями
+        fx = f(x)
+        if fx is None:
+            return None, None
+        return fx, df(x)
 
     x = x0
     for _ in range(max_iter):
-        fx = f(x)
-        dfx = df(x)
+        fx, dfx = f_df(x)
         if fx is None or dfx is None or dfx == 0:
             return None
         x_next = x - fx / dfx
@@ -87,6 +652,324 @@ def newton_method(x0, eps, max_iter=1000):
     return x
 
 
+# Метод Бройдена для систем нелінійних рівнянь F(x) = 0
+def broyden_method(F, x0, eps=1e-10, max_iter=100, refresh=None, line_search=True):
+    """
+    F — векторизована функція: масив (..., n) -> (..., n); провідні осі x0 —
+    незалежні системи, які розв'язуються одним пакетом.
+    Якобіан оцінюється скінченними різницями на старті, далі оновлюється
+    рангом 1 (Бройден). refresh=k — повторна оцінка кожні k ітерацій;
+    також завжди, коли лінійний пошук не зменшив нев'язку.
+    Повертає кортеж (розв'язки, маска збіжності, кількість ітерацій).
+    """
+    x0 = np.array(x0, dtype=float)
+    shape = x0.shape
+    n = shape[-1]
+    x = x0.reshape(-1, n)
+    Fx = np.asarray(F(x), dtype=float).reshape(-1, n)
+    J = _fd_jacobian(F, x, Fx)
+    iters = np.zeros(len(x), dtype=int)
+    converged = np.abs(Fx).max(axis=1) < eps
+
+    for k in range(max_iter):
+        idx = np.nonzero(~converged)[0]
+        if not idx.size:
+            break
+        xa, Fa, Ja = x[idx], Fx[idx], J[idx]
+        try:
+            dx = np.linalg.solve(Ja, -Fa[..., None])[..., 0]
+        except np.linalg.LinAlgError:
+            dx = -(np.linalg.pinv(Ja) @ Fa[..., None])[..., 0]
+
+        # пошук уздовж напрямку: крок ділиться навпіл, доки ||F|| не зменшиться
+        t = np.ones(len(idx))
+        x_new = xa + dx
+        F_new = np.asarray(F(x_new), dtype=float).reshape(-1, n)
+        norm0 = np.linalg.norm(Fa, axis=1)
+        bad = np.zeros(len(idx), dtype=bool)
+        if line_search:
+            for _ in range(20):
+                norm1 = np.linalg.norm(F_new, axis=1)
+                bad = ~(norm1 <= (1 - 1e-4 * t) * norm0)
+                if not bad.any():
+                    break
+                t[bad] /= 2
+                x_new[bad] = xa[bad] + t[bad, None] * dx[bad]
+                F_new[bad] = np.asarray(F(x_new[bad]), dtype=float).reshape(-1, n)
+
+        # оновлення Бройдена: J += (ΔF - J·s) sᵀ / (sᵀs)
+        s = x_new - xa
+        ss = np.einsum("ij,ij->i", s, s)
+        ss[ss == 0] = 1.0
+        r = F_new - Fa - np.einsum("ijk,ik->ij", Ja, s)
+        J_new = Ja + r[:, :, None] * s[:, None, :] / ss[:, None, None]
+
+        stale = bad | ~np.isfinite(J_new).all(axis=(1, 2))
+        if refresh and (k + 1) % refresh == 0:
+            stale[:] = True
+        if stale.any():
+            J_new[stale] = _fd_jacobian(F, x_new[stale], F_new[stale])
+
+        x[idx], Fx[idx], J[idx] = x_new, F_new, J_new
+        iters[idx] += 1
+        step = np.abs(s).max(axis=1) <= eps * (1 + np.abs(x_new).max(axis=1))
+        converged[idx] = (np.abs(F_new).max(axis=1) < eps) | (step & ~bad)
+
+    return x.reshape(shape), converged.reshape(shape[:-1]), iters.reshape(shape[:-1])
+
+
+# якобіан скінченними різницями: усі n зсунутих точок — одним викликом F
+def _fd_jacobian(F, x, Fx):
+    m, n = x.shape
+    h = np.sqrt(np.finfo(float).eps) * np.maximum(1.0, np.abs(x))
+    xs = x[:, None, :] + h[:, None, :] * np.eye(n)
+    Fs = np.asarray(F(xs.reshape(-1, n)), dtype=float).reshape(m, n, n)
+    return np.transpose((Fs - Fx[:, None, :]) / h[:, :, None], (0, 2, 1))
+
+
+# Усі (комплексні) корені многочлена методом Аберта–Ерліха
+def aberth_roots(coeffs, eps=1e-14, max_iter=200):
+    """
+    coeffs — коефіцієнти від старшого степеня (як у np.polyval).
+    Усі наближення уточнюються одночасно векторизованими кроками.
+    Повертає кортеж (корені, оцінки похибки): за теоремою про включення
+    у крузі радіусу n·(|p(z)| + γ·Σ|a_j||z|^j)/|p'(z)| навколо кожного z
+    є корінь (γ·Σ|a_j||z|^j — межа похибки округлення схеми Горнера).
+
+    >>> roots, bounds = aberth_roots([1, -5, 6])
+    >>> sorted(np.round(roots.real, 12)), bool(np.all(np.isfinite(bounds)))
+    ([np.float64(2.0), np.float64(3.0)], True)
+    >>> roots, bounds = aberth_roots([1, -3, 3, -1])  # (x - 1)³
+    >>> bool(np.all(np.abs(roots - 1) <= bounds))
+    True
+    """
+    c = np.trim_zeros(np.asarray(coeffs, dtype=complex), "f")
+    n_zero = len(c) - len(np.trim_zeros(c, "b"))  # нульові корені
+    c = np.trim_zeros(c, "b")
+    n = len(c) - 1
+    if n < 1:
+        return np.zeros(n_zero, dtype=complex), np.zeros(n_zero)
+    c = c / c[0]
+
+    # початкові наближення на колах, радіуси яких дає многокутник Ньютона
+    # (верхня опукла оболонка точок (j, ln|a_j|), a_j — коефіцієнт при z^j)
+    with np.errstate(divide="ignore"):
+        log_a = np.log(np.abs(c[::-1]))
+    hull = []
+    for j in np.nonzero(np.isfinite(log_a))[0]:
+        while len(hull) >= 2 and ((log_a[hull[-1]] - log_a[hull[-2]]) * (j - hull[-1])
+                                  <= (log_a[j] - log_a[hull[-1]]) * (hull[-1] - hull[-2])):
+            hull.pop()
+        hull.append(j)
+    z = []
+    for j0, j1 in zip(hull[:-1], hull[1:]):
+        m = j1 - j0
+        radius = np.exp((log_a[j0] - log_a[j1]) / m)
+        z.append(radius * np.exp(2j * np.pi * (np.arange(m) / m + j0 / n) + 0.4j))
+    z = np.concatenate(z)
+
+    active = np.ones(n, dtype=bool)
+    w_prev = np.full(n, np.inf)
+    for _ in range(max_iter):
+        idx = np.nonzero(active)[0]
+        if not idx.size:
+            break
+        ratio = _newton_ratio(c, z[idx])
+        # поправка Аберта: w = r / (1 - r·Σ 1/(z_i - z_j))
+        s = np.empty(idx.size, dtype=complex)
+        for lo in range(0, idx.size, 1024):
+            d = z[idx[lo:lo + 1024], None] - z[None, :]
+            d[np.arange(d.shape[0]), idx[lo:lo + 1024]] = np.inf
+            s[lo:lo + 1024] = (1 / d).sum(axis=1)
+        with np.errstate(invalid="ignore"):
+            w = ratio / (1 - ratio * s)
+        # нескінченні поправки (наприклад, при збігу наближень) не застосовуються
+        finite = np.isfinite(w)
+        w[~finite] = 0
+        z[idx] -= w
+        # зупинка: поправка досягла eps або перестала спадати (рівень округлення)
+        aw = np.abs(w)
+        stalled = (aw > 0.5 * w_prev[idx]) & (aw < np.sqrt(eps) * np.abs(z[idx]))
+        active[idx] = (aw > eps * np.abs(z[idx])) & ~stalled & finite
+        w_prev[idx] = aw
+
+    bound = _inclusion_radius(c, z)
+    roots = np.concatenate((z, np.zeros(n_zero, dtype=complex)))
+    return roots, np.concatenate((bound, np.zeros(n_zero)))
+
+
+# p(z)/p'(z) схемою Горнера; для |z| > 1 — через обернений многочлен (без переповнення)
+def _newton_ratio(c, z):
+    n = len(c) - 1
+    inner = np.abs(z) <= 1
+    zi = np.where(inner, z, 1 / z)
+    # для |z| > 1: p(z) = z^n·q(1/z), q — многочлен з оберненим порядком коефіцієнтів
+    p = np.where(inner, c[0], c[-1])
+    dp = np.zeros_like(z)
+    for j in range(1, n + 1):
+        dp = dp * zi + p
+        p = p * zi + np.where(inner, c[j], c[n - j])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        outer = z / (n - zi * dp / p)  # p/p' = z / (n - w·q'(w)/q(w)), w = 1/z
+        ratio = np.where(inner, p / dp, outer)
+    # точний корінь: поправка нульова (інакше 0/0 дає nan)
+    return np.where(p == 0, 0, ratio)
+
+
+# Радіус включення n·(|p(z)| + γ·Σ|a_j||z|^j)/|p'(z)|: доданок з γ = 2nu/(1 - 2nu)
+# враховує похибку обчислення p схемою Горнера; для |z| > 1 — через обернений многочлен
+def _inclusion_radius(c, z):
+    n = len(c) - 1
+    u = np.finfo(float).eps / 2
+    gamma = 2 * n * u / (1 - 2 * n * u)
+    inner = np.abs(z) <= 1
+    zi = np.where(inner, z, 1 / z)
+    azi = np.abs(zi)
+    p = np.where(inner, c[0], c[-1])
+    dp = np.zeros_like(z)
+    S = np.abs(p)
+    for j in range(1, n + 1):
+        dp = dp * zi + p
+        cj = np.where(inner, c[j], c[n - j])
+        p = p * zi + cj
+        S = S * azi + np.abs(cj)
+    # для |z| > 1: |p(z)| = |z|^n·|q(w)|, |p'(z)| = |z|^(n-1)·|n·q(w) - w·q'(w)|
+    deriv = np.where(inner, dp, n * p - zi * dp)
+    scale = np.where(inner, 1.0, np.abs(z))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return n * scale * (np.abs(p) + gamma * S) / np.abs(deriv)
+
+
+# Продовження за параметром для сімейства рівнянь F(x, p) = 0
+def continuation(F, params, x0, eps=1e-10, max_newton=8, window=1.0, n_scan=64, max_window=64.0):
+    """
+    F(x, p) — функція двох аргументів, записана через sin/cos/... (підтримує Dual);
+    для F через math.* чи np.* похідна береться центральною різницею.
+    Кожен розв'язок стартує з прогнозу за трьома попередніми коренями
+    і уточнюється хордовим методом Ньютона: похідна F'_x береться з
+    попереднього розв'язку й оновлюється через дуальні числа лише тоді,
+    коли збіжність сповільнюється. Біля точки повороту (F'_x ≈ 0) або якщо
+    Ньютон не зійшовся, корінь шукається брекетингом навколо прогнозу;
+    якщо у вікні window зміни знаку немає (гілка зникла за точкою повороту),
+    вікно розширюється вчетверо аж до max_window, і предиктор стартує заново
+    від знайденого кореня іншої гілки.
+    Генератор пар (p, корінь або None).
+    """
+    # три останні розв'язки (p, x) для предиктора і ваги інтерполяції Лагранжа;
+    # known — скільки з них придатні (різні p на одній гілці)
+    p1 = x1 = p2 = x2 = p3 = x3 = w1 = w2 = w3 = None
+    known = 0
+    x_last = float(x0)
+    slope = None  # F'_x з останнього оновлення
+    dual = True  # чи підтримує F дуальні числа
+    # звичайні float замість скалярів NumPy: арифметика з ними в рази швидша
+    if isinstance(params, np.ndarray):
+        params = params.tolist()
+    for p in map(float, params):
+        # предиктор: поліноміальна екстраполяція вздовж гілки
+        if known == 3:
+            d1, d2, d3 = p - p1, p - p2, p - p3
+            guess = x1 * d2 * d3 * w1 + x2 * d1 * d3 * w2 + x3 * d1 * d2 * w3
+        elif known == 2:
+            guess = x3 + (x3 - x2) * (p - p3) / (p3 - p2)
+        else:
+            guess = x_last
+
+        # коректор: хордовий Ньютон з оновленням похідної через дуальні числа
+        # (або різницями), похідна переноситься з попереднього розв'язку
+        root = None
+        x = guess
+        step_prev = math.inf
+        for _ in range(max_newton):
+            try:
+                if slope is None:
+                    fx, slope, dual = _value_slope(F, x, p, dual)
+                    if abs(slope) < 1e-12 * (1 + abs(fx)):
+                        slope = None
+                        break  # точка повороту
+                else:
+                    fx = F(x, p)
+                step = fx / slope
+            except (TypeError, ValueError, ZeroDivisionError):
+                break
+            x -= step
+            step = abs(step)
+            if step < eps:
+                root = x
+                break
+            if abs(x - guess) > window:
+                break  # стрибок з гілки
+            if step > 0.5 * step_prev:
+                slope = None  # похідна застаріла
+            step_prev = step
+
+        # запасний варіант: найближча до прогнозу зміна знаку + метод Брента;
+        # вікно розширюється, доки зміна знаку не знайдеться
+        if root is None:
+            slope = None
+            known = 0  # предиктор стартує заново від знайденого кореня
+            w = window
+            while root is None and w <= max_window:
+                root = _bracket_near(lambda t: F(t, p), guess, eps, w, n_scan)
+                w *= 4
+            if root is not None:
+                root = float(root)
+
+        yield p, root
+        if root is None:
+            known = 0
+            continue
+        x_last = root
+        p1, x1, p2, x2, p3, x3 = p2, x2, p3, x3, p, root
+        if known and p == p2:
+            known = 1
+        elif known < 3:
+            known += 1
+        if known == 3:
+            if p1 == p3:
+                known = 2
+            else:
+                w1 = 1 / ((p1 - p2) * (p1 - p3))
+                w2 = 1 / ((p2 - p1) * (p2 - p3))
+                w3 = 1 / ((p3 - p1) * (p3 - p2))
+
+
+# F(x, p) і F'_x: через дуальні числа, а якщо F їх не підтримує — центральною
+# різницею. Повертає (F, F'_x, чи підтримує F дуальні числа)
+def _value_slope(F, x, p, dual):
+    if dual:
+        try:
+            y = F(Dual(x, 1.0), p)
+        except TypeError:
+            y = None
+        if isinstance(y, Dual):
+            return y.value, y.deriv, True
+    h = 1e-6 * (1 + abs(x))  # малий крок для чисельної похідної
+    return F(x, p), (F(x + h, p) - F(x - h, p)) / (2 * h), False
+
+
+def _bracket_near(func, center, eps, window, n_scan):
+    xs = np.linspace(center - window, center + window, n_scan + 1)
+    ys = []
+    for x in xs:
+        try:
+            ys.append(func(x))
+        except (ValueError, ZeroDivisionError):
+            ys.append(None)
+    best = None
+    for i in range(n_scan):
+        y0, y1 = ys[i], ys[i + 1]
+        if y0 is None or y1 is None or y0 * y1 > 0:
+            continue
+        dist = abs((xs[i] + xs[i + 1]) / 2 - center)
+        if best is None or dist < best[0]:
+            best = (dist, xs[i], xs[i + 1])
+    if best is None:
+        return None
+    root, _ = brent_method(float(best[1]), float(best[2]), eps, func=func, trace=False)
+    return root
+
+
 # --- ГОЛОВНЕ ВІКНО ---
 class EquationSolver(QMainWindow):
     def __init__(self):
@@ -115,12 +998,20 @@ class EquationSolver(QMainWindow):
         self.btn_solve.clicked.connect(self.calculate)
         self.btn_solve.setEnabled(False)
 
+        self.btn_all = QPushButton("Знайти всі корені")
+        self.btn_all.clicked.connect(self.solve_all)
+        self.btn_all.setEnabled(False)
+
         self.btn_save = QPushButton("Зберегти результат")
         self.btn_save.clicked.connect(self.save_results)
 
         # Список відрізків
         self.combo_intervals = QComboBox()
 
+        # Метод уточнення кореня на відрізку
+        self.combo_method = QComboBox()
+        self.combo_method.addItems(["Бісекція", "Брент"])
+
         # Таблиця результатів
         self.table = QTableWidget()
         self.table.setColumnCount(4)
@@ -140,12 +1031,15 @@ class EquationSolver(QMainWindow):
         input_layout.addWidget(self.input_eps)
         input_layout.addWidget(self.btn_calc)
         input_layout.addWidget(self.btn_solve)
+        input_layout.addWidget(self.btn_all)
         input_layout.addWidget(self.btn_save)
 
         main_layout = QVBoxLayout()
         main_layout.addLayout(input_layout)
         main_layout.addWidget(QLabel("Виберіть відрізок з коренем:"))
         main_layout.addWidget(self.combo_intervals)
+        main_layout.addWidget(QLabel("Метод уточнення кореня:"))
+        main_layout.addWidget(self.combo_method)
         main_layout.addWidget(self.table)
         main_layout.addWidget(self.canvas)
 
@@ -161,28 +1055,20 @@ class EquationSolver(QMainWindow):
         b = float(self.input_b.text())
         eps = float(self.input_eps.text())
 
-        step = 0.5  # крок пошуку
-        x = a
-        intervals = []
-
-        while x < b:
-            x_next = x + step
-            if f(x) * f(x_next) < 0:
-                intervals.append((x, x_next))
-            x = x_next
-
-            
+        intervals = [(a_i, b_i) for a_i, b_i in find_brackets(f_vec, a, b).tolist()]
 
         if not intervals:
             self.status_bar.showMessage("Коренів не знайдено на цьому проміжку.")
             self.btn_solve.setEnabled(False)
+            self.btn_all.setEnabled(False)
             self.combo_intervals.clear()
         else:
             self.status_bar.showMessage(f"Знайдено {len(intervals)} коренів.")
             self.combo_intervals.clear()
             for i, (a_i, b_i) in enumerate(intervals):
-                self.combo_intervals.addItem(f"[{a_i:.2f}, {b_i:.2f}]")
+                self.combo_intervals.addItem(f"[{a_i:.4f}, {b_i:.4f}]")
             self.btn_solve.setEnabled(True)
+            self.btn_all.setEnabled(True)
             self.intervals = intervals
 
     # --- 2. Обчислення обраного кореня ---
@@ -191,15 +1077,19 @@ class EquationSolver(QMainWindow):
         idx = self.combo_intervals.currentIndex()
         a, b = self.intervals[idx]
 
-        # Метод дихотомії
-        root_bis, results = bisection(a, b, eps)
+        # Метод дихотомії або Брента
+        method = self.combo_method.currentText()
+        if method == "Брент":
+            root_bis, results = brent_method(a, b, eps)
+        else:
+            root_bis, results = bisection(a, b, eps)
         if root_bis is None:
             self.status_bar.showMessage("На цьому відрізку не знайдено корінь.")
             return
 
         # Метод ітерацій
         x0 = (a + b) / 2
-        root_iter, results_iter = iteration_method(f, x0, eps)
+        root_iter, results_iter = iteration_method(f, x0, eps, accel="steffensen", relax=True)
 
         # # Метод Ньютона
         root_newton = newton_method(x0, eps)
@@ -210,7 +1100,7 @@ class EquationSolver(QMainWindow):
         # )
 
         msg = []
-        msg.append(f"Бісекція: x = {root_bis:.3f}")
+        msg.append(f"{method}: x = {root_bis:.3f}")
         if root_iter is not None:
             msg.append(f"Ітерації: x = {root_iter:.3f}")
         else:
@@ -236,6 +1126,30 @@ class EquationSolver(QMainWindow):
 
         self.results = results
         self.root = root_bis
+        self.method = method
+
+    # --- Уточнення всіх знайдених коренів одним пакетом ---
+    def solve_all(self):
+        eps = float(self.input_eps.text())
+        a, b = np.array(self.intervals).T
+        roots, iters = batch_roots(f_vec, a, b, eps)
+        f_roots = f_vec(roots)
+
+        results = list(zip(a.tolist(), b.tolist(), roots.tolist(), f_roots.tolist()))
+        self.table.setRowCount(len(results))
+        for i, (a_i, b_i, c, fc) in enumerate(results):
+            self.table.setItem(i, 0, QTableWidgetItem(f"{a_i:.6f}"))
+            self.table.setItem(i, 1, QTableWidgetItem(f"{b_i:.6f}"))
+            self.table.setItem(i, 2, QTableWidgetItem(f"{c:.6f}"))
+            self.table.setItem(i, 3, QTableWidgetItem(f"{fc:.6f}"))
+
+        found = int(np.isfinite(roots).sum())
+        self.status_bar.showMessage(
+            f"Уточнено {found} з {len(roots)} коренів (Іллінойс), максимум ітерацій: {iters.max()}"
+        )
+        self.results = results
+        self.root = None
+        self.method = "Іллінойс, усі корені"
 
     # --- 3. Побудова графіка ---
     def plot_function(self, a, b, root):
@@ -255,8 +1169,10 @@ class EquationSolver(QMainWindow):
         filename, _ = QFileDialog.getSaveFileName(self, "Зберегти файл", "", "Text Files (*.txt)")
         if filename:
             with open(filename, "w") as f:
-                f.write("Результати обчислень (метод бісекції)\n")
-                f.write(f"Корінь: x = {self.root:.6f}\n\n")
+                f.write(f"Результати обчислень (метод: {self.method})\n")
+                if self.root is not None:
+                    f.write(f"Корінь: x = {self.root:.6f}\n")
+                f.write("\n")
                 f.write("a\tb\tc\tf(c)\n")
                 for a_i, b_i, c, fc in self.results:
                     f.write(f"{a_i:.6f}\t{b_i:.6f}\t{c:.6f}\t{fc:.6f}\n")
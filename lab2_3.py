@@ -1,42 +1,556 @@
+import os
 import sys
 import math
+import time
+import heapq
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 import numpy as np
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QLabel, QLineEdit,
     QPushButton, QVBoxLayout, QHBoxLayout, QTableWidget,
-    QTableWidgetItem, QFileDialog, QStatusBar
+    QTableWidgetItem, QFileDialog, QStatusBar, QComboBox
 )
 from PyQt6.QtGui import QFont
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
 
-# функція для інтегрування
+# функція для інтегрування (приймає і число, і масив NumPy)
 def f(x):
-    return 1 / math.sqrt(12 * x ** 2 + 0.5)
+    return 1 / np.sqrt(12 * x ** 2 + 0.5)
+
+
+# розмір порції точок, що обчислюються за один виклик f
+CHUNK = 1 << 20
+
+
+# значення func на масиві x: одним викликом, якщо func векторизована,
+# інакше (функція лише для чисел, наприклад через math) — поелементно
+def eval_f(func, x):
+    x = np.asarray(x, dtype=float)
+    try:
+        y = np.asarray(func(x), dtype=float)
+        if y.shape == x.shape:
+            return y
+    except (TypeError, ValueError):
+        pass
+    return np.fromiter((func(xi) for xi in x.ravel()), dtype=float, count=x.size).reshape(x.shape)
+
+
+# сума func(a + (i + shift)·h), i = 0..n-1, порціями по CHUNK точок
+def grid_sum(func, a, h, n, shift=0.0):
+    total = 0.0
+    for start in range(0, n, CHUNK):
+        i = np.arange(start, min(start + CHUNK, n), dtype=float)
+        total += eval_f(func, a + (i + shift) * h).sum()
+    return total
 
 
 # метод прямокутників
 def rectangle_method(a, b, n):
     h = (b - a) / n
-    x = np.linspace(a + h/2, b - h/2, n)  # середні прямокутники
-    y = [f(xi) for xi in x]
-    return h * sum(y)
+    return h * grid_sum(f, a, h, n, shift=0.5)  # середні прямокутники
 
 
 # метод трапецій
 def trapezoid_method(a, b, n):
     h = (b - a) / n
+    ends = eval_f(f, [a, b])
+    return h * ((ends[0] + ends[1]) / 2 + grid_sum(f, a + h, h, n - 1))
+
+
+# метод Ромберга на вкладених сітках: N подвоюється, і на кожному рівні f
+# обчислюється лише в нових серединах (T_2N = (T_N + M_N) / 2).
+# повертає рядки (N, прямокутники, трапеції, Ромберг, оцінка похибки)
+def romberg(a, b, n0=10, levels=5):
+    n = n0
+    h = (b - a) / n
+    ends = eval_f(f, [a, b])
+    trap = h * ((ends[0] + ends[1]) / 2 + grid_sum(f, a + h, h, n - 1))
+    rows = []
+    prev = []
+    for k in range(levels):
+        h = (b - a) / n
+        mid = h * grid_sum(f, a, h, n, shift=0.5)
+        # рядок таблиці Річардсона: R[k][j] = R[k][j-1] + (R[k][j-1] - R[k-1][j-1]) / (4^j - 1)
+        cur = [trap]
+        for j, r in enumerate(prev, 1):
+            cur.append(cur[-1] + (cur[-1] - r) / (4 ** j - 1))
+        err = abs(cur[-1] - cur[-2]) if k > 0 else abs(mid - trap) / 3
+        rows.append((n, mid, trap, cur[-1], err))
+        prev = cur
+        trap = (trap + mid) / 2
+        n *= 2
+    return rows
+
+
+# каталог для збереження вузлів Гаусса–Лежандра на диску (None — лише кеш у пам'яті)
+GL_CACHE_DIR = None
+
+
+# заміна змінної x(t), вага x'(t) для методу tanh-sinh: скінченний відрізок
+# (tanh-sinh), півпрямі (exp-sinh) та вся пряма (sinh-sinh). повертає також
+# точні відстані до кінців da = x - a і db = b - x (нескінченні для нескінченних меж)
+def de_transform(a, b, t):
+    u = np.pi / 2 * np.sinh(t)
+    du = np.pi / 2 * np.cosh(t)
+    if math.isinf(a) and math.isinf(b):
+        x = np.sinh(u)
+        return x, du * np.cosh(u), x - a, b - x
+    if math.isinf(b):
+        e = np.exp(u)
+        return a + e, du * e, e, b - a - e
+    if math.isinf(a):
+        e = np.exp(u)
+        return b - e, du * e, b - a - e, e
+    # відстань до ближчого кінця обчислюється окремо, щоб не втратити точність біля особливості
+    r = (b - a) / 2
+    e = np.exp(-2 * np.abs(u))
+    d = r * 2 * e / (1 + e)
+    x = np.where(t < 0, a + d, b - d)
+    da = np.where(t < 0, d, 2 * r - d)
+    db = np.where(t < 0, 2 * r - d, d)
+    return x, r * du * 4 * e / (1 + e) ** 2, da, db  # 1/cosh² u без переповнення
+
+
+# метод tanh-sinh (подвійна експонента) для інтегровних особливостей на кінцях
+# і нескінченних меж (a = -inf або b = inf). крок h ділиться навпіл, і на кожному
+# рівні f обчислюється лише в нових вузлах; повертає (значення, похибка, кількість обчислень f).
+# f отримує лише x, тож біля кінця a ≠ 0 вона сама рахує x - a чи b - x із втратою
+# точності. вузли, де ця різниця далека від точної відстані, додають до оцінки похибки
+# розкид f відносно найближчого точного вузла (нескінченність, якщо f там не скінченна).
+# для особливостей на кінцях краще задати func(x, da, db) — підінтегральну функцію
+# від x і точних відстаней до кінців da = x - a, db = b - x
+def tanh_sinh(a, b, eps=1e-12, max_level=10, t_max=6.5, func=None):
+    def level_sum(t):
+        x, w, da, db = de_transform(a, b, t)
+        near = np.minimum(da, db)
+        keep = (w > 0) & (near > 0) & np.isfinite(x)
+        x, w, da, db, near = x[keep], w[keep], da[keep], db[keep], near[keep]
+        if func is not None:
+            return np.dot(w, np.asarray(func(x, da, db), dtype=float)), 0.0, x.size
+        with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+            y = eval_f(f, x)
+            # вузли, положення яких відносно ближчого кінця спотворене округленням
+            left = da <= db
+            inexact = np.abs(np.where(left, x - a, b - x) - near) > 1e-3 * near
+            if np.any(~np.isfinite(y) & inexact):
+                ok = np.isfinite(y) | ~inexact
+                return np.dot(w[ok], y[ok]), float("inf"), x.size
+            tail = 0.0
+            for side in (left, ~left):
+                exact = side & ~inexact
+                ref = y[exact][np.argmin(near[exact])] if exact.any() else 0.0
+                tail += np.dot(w[side & inexact], np.abs(y[side & inexact] - ref))
+            return np.dot(w, y), tail, x.size
+
+    h = 0.5
+    total, tail, evals = level_sum(np.arange(-t_max, t_max + h / 2, h))
+    value = h * total
+    err = float("inf")
+    for _ in range(max_level):
+        h /= 2
+        t = np.arange(-t_max + h, t_max, 2 * h)  # лише нові вузли
+        part, part_tail, count = level_sum(t)
+        total += part
+        tail += part_tail
+        evals += count
+        value, prev = h * total, value
+        err = abs(value - prev)
+        # збіглися, або f не скінченна у вузлах зі спотвореним положенням — уточнення не допоможе
+        if err <= eps * max(abs(value), 1.0) or math.isinf(tail):
+            break
+    return value, max(err, h * tail), evals
+
+
+# многочлен Лежандра P_n та його похідна в точках x (рекурентна формула)
+def legendre(n, x):
+    p0, p1 = np.ones_like(x), x
+    for k in range(2, n + 1):
+        p0, p1 = p1, ((2 * k - 1) * x * p1 - (k - 1) * p0) / k
+    return p1, n * (x * p1 - p0) / (x * x - 1)
+
+
+# вузли та ваги Гаусса–Лежандра порядку n на [-1, 1]: метод Ньютона для коренів
+# многочлена Лежандра одразу для всіх вузлів.
+# результати кешуються в пам'яті (LRU) і, якщо задано GL_CACHE_DIR, у файлах .npy
+@lru_cache(maxsize=32)
+def gauss_legendre_nodes(n):
+    path = os.path.join(GL_CACHE_DIR, f"gauss_legendre_{n}.npy") if GL_CACHE_DIR else None
+    if path and os.path.exists(path):
+        x, w = np.load(path)
+    else:
+        i = np.arange(1, n + 1)
+        x = np.cos(np.pi * (i - 0.25) / (n + 0.5))  # початкове наближення
+        for _ in range(10):
+            p, dp = legendre(n, x)
+            dx = p / dp
+            x = x - dx
+            if np.max(np.abs(dx)) < 1e-14:
+                break
+        _, dp = legendre(n, x)
+        w = 2 / ((1 - x * x) * dp * dp)
+        if path:
+            os.makedirs(GL_CACHE_DIR, exist_ok=True)
+            np.save(path, np.array([x, w]))
+    # масиви спільні для всіх викликів, тому лише для читання
+    x.setflags(write=False)
+    w.setflags(write=False)
+    return x, w
+
+
+# метод Гаусса–Лежандра з n вузлами
+def gauss_legendre_method(a, b, n):
+    x, w = gauss_legendre_nodes(n)
+    r = (b - a) / 2
+    return r * np.dot(w, eval_f(f, r * x + (a + b) / 2))
+
+
+# вузли та ваги Кронрода (15 точок) і Гаусса (7 точок) на [-1, 1];
+# вузли Гаусса — кожен другий вузол Кронрода, тож f рахується лише 15 разів
+GK_X = np.array([0.991455371120812639206854697526329, 0.949107912342758524526189684047851,
+                 0.864864423359769072789712788640926, 0.741531185599394439863864773280788,
+                 0.586087235467691130294144845693013, 0.405845151377397166906606412076961,
+                 0.207784955007898467600689403773245, 0.0])
+GK_WK = np.array([0.022935322010529224963732008058970, 0.063092092629978553290700663189204,
+                  0.104790010322250183839876322541518, 0.140653259715525918745189590510238,
+                  0.169004726639267902826583426598550, 0.190350578064785409913256402421014,
+                  0.204432940075298892414161999234649, 0.209482141084727828012999174891714])
+GK_WG = np.array([0.0, 0.129484966168869693270611432679082,
+                  0.0, 0.279705391489276667901467771423780,
+                  0.0, 0.381830050505118944950369775488975,
+                  0.0, 0.417959183673469387755102040816327])
+GK_NODES = np.concatenate((-GK_X[:-1], GK_X[::-1]))
+GK_WK = np.concatenate((GK_WK[:-1], GK_WK[::-1]))
+GK_WG = np.concatenate((GK_WG[:-1], GK_WG[::-1]))
+
+
+# правило G7K15 на [lo, hi]: (значення Кронрода, |Кронрод - Гаусс|)
+def gk15(lo, hi):
+    c = (lo + hi) / 2
+    r = (hi - lo) / 2
+    y = eval_f(f, c + r * GK_NODES)
+    k = r * np.dot(GK_WK, y)
+    return k, abs(k - r * np.dot(GK_WG, y))
+
+
+# адаптивний метод Гаусса–Кронрода: навпіл ділиться лише відрізок з найбільшою
+# локальною похибкою (черга з пріоритетом), доки сумарна похибка не стане
+# меншою за max(eps_abs, eps_rel·|I|). повертає (значення, похибка, кількість обчислень f)
+def gauss_kronrod(a, b, eps_abs=1e-10, eps_rel=1e-10, max_intervals=1000):
+    value, err = gk15(a, b)
+    evals = 15
+    heap = [(-err, a, b, value)]
+    while err > max(eps_abs, eps_rel * abs(value)) and len(heap) < max_intervals:
+        e, lo, hi, v = heapq.heappop(heap)
+        mid = (lo + hi) / 2
+        if not lo < mid < hi:
+            heapq.heappush(heap, (e, lo, hi, v))
+            break
+        v1, e1 = gk15(lo, mid)
+        v2, e2 = gk15(mid, hi)
+        evals += 30
+        heapq.heappush(heap, (-e1, lo, mid, v1))
+        heapq.heappush(heap, (-e2, mid, hi, v2))
+        value += v1 + v2 - v
+        err += e1 + e2 + e
+    # підсумок заново, щоб не накопичувати похибку округлення
+    value = math.fsum(v for _, _, _, v in heap)
+    err = math.fsum(-e for e, _, _, _ in heap)
+    return value, err, evals
+
+
+# статистика вибірки: (кількість, середнє, сума квадратів відхилень)
+def sample_stats(y):
+    m = y.mean()
+    return y.size, m, np.dot(y - m, y - m)
+
+
+# об'єднання статистик двох вибірок (формула Чана)
+def merge_stats(s1, s2):
+    n1, m1, q1 = s1
+    n2, m2, q2 = s2
+    n = n1 + n2
+    if n == 0:
+        return s1
+    d = m2 - m1
+    return n, m1 + d * n2 / n, q1 + q2 + d * d * n1 * n2 / n
+
+
+# перші n точок послідовності ван дер Корпута за основою 2 (одновимірні
+# послідовності Соболя і Гальтона), починаючи з номера start + 1
+def van_der_corput(n, start=0):
+    i = np.arange(start + 1, start + n + 1, dtype=np.uint64)
+    x = np.zeros(n)
+    scale = 0.5
+    while i.any():
+        x += scale * (i & 1)
+        i >>= 1
+        scale /= 2
+    return x
+
+
+# одна порція паралельного методу Монте-Карло: статистика f у size точках
+# з власного генератора
+def mc_chunk(a, b, size, seed):
+    rng = np.random.default_rng(seed)
+    return sample_stats(eval_f(f, rng.uniform(a, b, size)))
+
+
+# паралельний метод Монте-Карло: N ділиться на порції по CHUNK точок, і кожна
+# порція отримує власний генератор, породжений із SeedSequence(seed).
+# порції об'єднуються по порядку, тож за однакового seed результат однаковий
+# до біта за будь-якої кількості процесів. повертає (значення, стандартна похибка)
+def parallel_monte_carlo(a, b, n, seed=None, workers=None):
+    sizes = [min(CHUNK, n - start) for start in range(0, n, CHUNK)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    args = ([a] * len(sizes), [b] * len(sizes), sizes, seeds)
+    stats = (0, 0.0, 0.0)
+    if workers == 1 or len(sizes) == 1:
+        for part in map(mc_chunk, *args):
+            stats = merge_stats(stats, part)
+    else:
+        with ProcessPoolExecutor(workers) as pool:
+            for part in pool.map(mc_chunk, *args, chunksize=16):
+                stats = merge_stats(stats, part)
+    count, mean, q = stats
+    se = math.sqrt(q / (count - 1) / count) if count > 1 else float("nan")
+    return (b - a) * mean, (b - a) * se
+
+
+# потоковий метод Монте-Карло: після кожної порції точок повертає (поточне значення,
+# стандартна похибка, кількість точок). зупиняється, коли напівширина довірчого
+# інтервалу z·se не більша за tol або минуло time_limit секунд; порції ростуть
+# удвічі від batch до CHUNK
+def monte_carlo_stream(a, b, tol, time_limit=10.0, batch=1000, z=1.96, seed=None):
+    rng = np.random.default_rng(seed)
+    deadline = time.monotonic() + time_limit
+    stats = (0, 0.0, 0.0)
+    while True:
+        stats = merge_stats(stats, sample_stats(eval_f(f, rng.uniform(a, b, batch))))
+        count, mean, q = stats
+        se = (b - a) * math.sqrt(q / (count - 1) / count)
+        yield (b - a) * mean, se, count
+        if z * se <= tol or time.monotonic() >= deadline:
+            return
+        batch = min(2 * batch, CHUNK)
+
+
+# варіанти методу Монте-Карло
+MC_VARIANTS = {
+    "qmc": "Квазі-Монте-Карло (Соболь)",
+    "plain": "Звичайний",
+    "antithetic": "Антитетичний",
+    "stratified": "Стратифікований",
+    "control": "Контрольна змінна",
+    "parallel": "Паралельний (із зерном)",
+}
+
+
+# метод Монте-Карло; повертає (значення, стандартна похибка).
+# variant: "plain" — рівномірні випадкові точки, "antithetic" — пари x і a + b - x,
+# "stratified" — по дві точки в кожному з n/2 рівних підвідрізків,
+# "control" — контрольна змінна x з відомим інтегралом,
+# "qmc" — скрембльована послідовність ван дер Корпута (Соболь), похибка за
+# replicates незалежними скремблюваннями, "parallel" — parallel_monte_carlo.
+# seed задає генератор для всіх варіантів: за однакового seed результат однаковий
+def monte_carlo_method(a, b, n, variant="plain", replicates=16, seed=None):
+    width = b - a
+    if variant == "parallel":
+        return parallel_monte_carlo(a, b, n, seed)
+    rng = np.random.default_rng(seed)
+    if variant == "plain":
+        stats = (0, 0.0, 0.0)
+        for start in range(0, n, CHUNK):
+            x = rng.uniform(a, b, min(CHUNK, n - start))
+            stats = merge_stats(stats, sample_stats(eval_f(f, x)))
+    elif variant == "antithetic":
+        stats = (0, 0.0, 0.0)
+        pairs = max(n // 2, 1)
+        for start in range(0, pairs, CHUNK):
+            x = rng.uniform(a, b, min(CHUNK, pairs - start))
+            y = (eval_f(f, x) + eval_f(f, a + b - x)) / 2
+            stats = merge_stats(stats, sample_stats(y))
+    elif variant == "stratified":
+        k = max(n // 2, 1)
+        h = width / k
+        total = 0.0
+        var = 0.0
+        for start in range(0, k, CHUNK):
+            j = np.arange(start, min(start + CHUNK, k), dtype=float)
+            y1 = eval_f(f, a + (j + rng.uniform(size=j.size)) * h)
+            y2 = eval_f(f, a + (j + rng.uniform(size=j.size)) * h)
+            total += (y1 + y2).sum() / 2
+            var += np.dot(y1 - y2, y1 - y2) / 4
+        return h * total, h * math.sqrt(var)
+    elif variant == "control":
+        # y - beta·(x - c): c = (a + b) / 2 — точне середнє x, beta — з першої порції
+        c = (a + b) / 2
+        stats = (0, 0.0, 0.0)
+        beta = None
+        for start in range(0, n, CHUNK):
+            u = rng.uniform(a, b, min(CHUNK, n - start)) - c
+            y = eval_f(f, u + c)
+            if beta is None:
+                beta = np.dot(u, y - y.mean()) / np.dot(u, u) if u.size > 1 else 0.0
+            stats = merge_stats(stats, sample_stats(y - beta * u))
+    elif variant == "qmc":
+        replicates = max(min(replicates, n // 2), 2)
+        m = max(n // replicates, 1)
+        values = np.empty(replicates)
+        for r in range(replicates):
+            # випадковий цифровий зсув (XOR) усіх двійкових розрядів
+            shift = rng.integers(0, 1 << 53, dtype=np.uint64)
+            total = 0.0
+            for start in range(0, m, CHUNK):
+                bits = (van_der_corput(min(CHUNK, m - start), start) * (1 << 53)).astype(np.uint64)
+                u = (bits ^ shift) / (1 << 53)
+                total += eval_f(f, a + width * u).sum()
+            values[r] = width * total / m
+        return values.mean(), values.std(ddof=1) / math.sqrt(replicates)
+    else:
+        raise ValueError(f"Невідомий варіант методу Монте-Карло: {variant}")
+    count, mean, q = stats
+    se = math.sqrt(q / (count - 1) / count) if count > 1 else float("nan")
+    return width * mean, width * se
+
+
+# первісна F(x_i) = ∫_a^x_i f(t) dt в усіх n + 1 вузлах рівномірної сітки за один прохід
+# (накопичувальні суми): method "trapezoid" — трапеції, "simpson" — формула Сімпсона
+# на кожному підінтервалі (з додатковими середніми точками). повертає (x, F, f(x))
+def cumulative_integral(a, b, n, method="simpson"):
     x = np.linspace(a, b, n + 1)
-    y = [f(xi) for xi in x]
-    return (h / 2) * (y[0] + 2 * sum(y[1:-1]) + y[-1])
+    y = eval_f(f, x)
+    h = (b - a) / n
+    F = np.zeros(n + 1)
+    if method == "trapezoid":
+        F[1:] = np.cumsum(h / 2 * (y[:-1] + y[1:]))
+    elif method == "simpson":
+        mid = eval_f(f, x[:-1] + h / 2)
+        F[1:] = np.cumsum(h / 6 * (y[:-1] + 4 * mid + y[1:]))
+    else:
+        raise ValueError(f"Невідомий метод: {method}")
+    return x, F, y
+
+
+# таблиця первісної для швидких запитів F(x) і F⁻¹(y): кубічна ермітова інтерполяція
+# між вузлами (похідна F відома — це f), обернення методом Ньютона в межах комірки
+class CumulativeTable:
+    def __init__(self, a, b, n=1000, method="simpson"):
+        self.a = a
+        self.h = (b - a) / n
+        self.x, self.F, self.dF = cumulative_integral(a, b, n, method)
+        self.monotone = bool(np.all(np.diff(self.F) >= 0))
+
+    # значення кубічного полінома Ерміта на комірці i в точці з частиною s ∈ [0, 1]
+    def _hermite(self, i, s):
+        F0, F1 = self.F[i], self.F[i + 1]
+        d0, d1 = self.h * self.dF[i], self.h * self.dF[i + 1]
+        s2 = s * s
+        s3 = s2 * s
+        return ((2 * s3 - 3 * s2 + 1) * F0 + (s3 - 2 * s2 + s) * d0
+                + (-2 * s3 + 3 * s2) * F1 + (s3 - s2) * d1)
 
+    # F(x) для числа або масиву x ∈ [a, b]
+    def __call__(self, x):
+        x = np.asarray(x, dtype=float)
+        pos = (x - self.a) / self.h
+        i = np.clip(np.floor(pos).astype(int), 0, len(self.x) - 2)
+        return self._hermite(i, pos - i)
 
-# метод Монте-Карло
-def monte_carlo_method(a, b, n):
-    x = np.random.uniform(a, b, n)
-    y = [f(xi) for xi in x]
-    return (b - a) * np.mean(y)
+    # F⁻¹(y): x, для якого F(x) = y; лише для монотонно зростаючої F (f ≥ 0)
+    def inverse(self, y, eps=1e-12, max_iter=20):
+        if not self.monotone:
+            raise ValueError("Первісна не монотонна — обернення неоднозначне")
+        y = np.asarray(y, dtype=float)
+        i = np.clip(np.searchsorted(self.F, y, side="right") - 1, 0, len(self.x) - 2)
+        F0, F1 = self.F[i], self.F[i + 1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            s = np.where(F1 > F0, (y - F0) / (F1 - F0), 0.0)  # лінійне наближення
+        for _ in range(max_iter):
+            s2 = s * s
+            # похідна полінома Ерміта за s
+            d = ((6 * s2 - 6 * s) * self.F[i] + (3 * s2 - 4 * s + 1) * self.h * self.dF[i]
+                 + (-6 * s2 + 6 * s) * self.F[i + 1] + (3 * s2 - 2 * s) * self.h * self.dF[i + 1])
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ds = np.where(d > 0, (self._hermite(i, s) - y) / d, 0.0)
+            s = np.clip(s - ds, 0.0, 1.0)
+            if np.max(np.abs(ds), initial=0.0) < eps:
+                break
+        return self.x[i] + s * self.h
+
+
+# перенесення рівномірних точок y з [0, 1)^d у вузли сітки VEGAS;
+# повертає точки в [0, 1)^d, якобіан і номери комірок
+def vegas_map(edges, y):
+    bins = edges.shape[1] - 1
+    pos = y * bins
+    idx = np.minimum(pos.astype(int), bins - 1)
+    dims = np.arange(edges.shape[0])
+    left = edges[dims, idx]
+    width = edges[dims, idx + 1] - left
+    return left + (pos - idx) * width, np.prod(bins * width, axis=1), idx
+
+
+# перебудова сітки VEGAS: вага комірки — згладжена частка суми f², стиснена
+# ((r - 1) / ln r)^alpha; нові межі ділять сумарну вагу порівну
+def vegas_refine(edges, d, alpha):
+    sm = d.copy()
+    sm[:, 1:-1] = (d[:, :-2] + d[:, 1:-1] + d[:, 2:]) / 3
+    sm[:, 0] = (d[:, 0] + d[:, 1]) / 2
+    sm[:, -1] = (d[:, -2] + d[:, -1]) / 2
+    total = sm.sum(axis=1, keepdims=True)
+    if not np.all(total > 0):
+        return edges
+    r = sm / total
+    with np.errstate(divide="ignore", invalid="ignore"):
+        w = np.where(r <= 0, 0.0, np.where(r < 1, ((r - 1) / np.log(r)) ** alpha, 1.0))
+    cum = np.zeros_like(edges)
+    cum[:, 1:] = np.cumsum(w, axis=1)
+    cum /= cum[:, -1:]
+    targets = np.linspace(0.0, 1.0, edges.shape[1])
+    return np.array([np.interp(targets, cum[k], edges[k]) for k in range(edges.shape[0])])
+
+
+# багатовимірний метод Монте-Карло VEGAS на паралелепіпеді [lower, upper]:
+# роздільна вибірка за значимістю на адаптивній сітці (bins комірок на вимір),
+# що уточнюється після кожної з iterations ітерацій по n точок.
+# func приймає масив точок (m, d) і повертає m значень.
+# повертає (зважена оцінка, стандартна похибка, χ² на ступінь свободи);
+# перша ітерація лише налаштовує сітку і в оцінку не входить
+def vegas(func, lower, upper, n=10000, iterations=10, bins=50, alpha=1.5, seed=None):
+    lower = np.asarray(lower, dtype=float)
+    upper = np.asarray(upper, dtype=float)
+    dim = lower.size
+    volume = np.prod(upper - lower)
+    rng = np.random.default_rng(seed)
+    edges = np.tile(np.linspace(0.0, 1.0, bins + 1), (dim, 1))
+    chunk = max(CHUNK // dim, 1)
+    estimates = []
+    for it in range(iterations):
+        d = np.zeros((dim, bins))
+        stats = (0, 0.0, 0.0)
+        for start in range(0, n, chunk):
+            y = rng.random((min(chunk, n - start), dim))
+            u, jac, idx = vegas_map(edges, y)
+            fx = np.asarray(func(lower + (upper - lower) * u), dtype=float) * jac * volume
+            stats = merge_stats(stats, sample_stats(fx))
+            for k in range(dim):
+                d[k] += np.bincount(idx[:, k], weights=fx * fx, minlength=bins)
+        count, mean, q = stats
+        if it > 0 or iterations == 1:
+            estimates.append((mean, q / (count - 1) / count))
+        edges = vegas_refine(edges, d, alpha)
+    values = np.array([e[0] for e in estimates])
+    variances = np.array([e[1] for e in estimates])
+    if np.any(variances == 0):
+        # точна підінтегральна функція (наприклад, стала) — похибка нульова
+        return values[-1], 0.0, 0.0
+    weights = 1 / variances
+    value = np.dot(weights, values) / weights.sum()
+    chi2 = np.dot(weights, (values - value) ** 2) / (len(values) - 1) if len(values) > 1 else 0.0
+    return value, math.sqrt(1 / weights.sum()), chi2
 
 
 # головне вікно
@@ -45,6 +559,7 @@ class IntegralSolver(QMainWindow):
         super().__init__()
         self.setWindowTitle("Integral Solver – 1 / √(12x² + 0.5)")
         self.setFixedSize(850, 650)
+        self.stream = None
         self.initUI()
 
     def initUI(self):
@@ -65,10 +580,25 @@ class IntegralSolver(QMainWindow):
         self.btn_save = QPushButton("Зберегти результат")
         self.btn_save.clicked.connect(self.save_results)
 
+        # варіант методу Монте-Карло
+        self.combo_mc = QComboBox()
+        for key, name in MC_VARIANTS.items():
+            self.combo_mc.addItem(name, key)
+        self.label_seed = QLabel("Зерно:")
+        self.input_seed = QLineEdit("")
+
+        # потоковий Монте-Карло до заданої точності
+        self.label_tol = QLabel("Точність Монте-Карло:")
+        self.input_tol = QLineEdit("1e-4")
+        self.label_time = QLabel("Ліміт часу, с:")
+        self.input_time = QLineEdit("10")
+        self.btn_stream = QPushButton("Монте-Карло до точності")
+        self.btn_stream.clicked.connect(self.run_stream)
+
         # таблиця результатів
         self.table = QTableWidget()
-        self.table.setColumnCount(4)
-        self.table.setHorizontalHeaderLabels(["N", "Прямокутники", "Трапеції", "Монте-Карло"])
+        self.table.setColumnCount(7)
+        self.table.setHorizontalHeaderLabels(["N", "Прямокутники", "Трапеції", "Ромберг", "Похибка", "Гаусс–Лежандр", "Монте-Карло"])
 
         # поле для графіка
         self.figure = Figure(figsize=(5, 3))
@@ -82,11 +612,22 @@ class IntegralSolver(QMainWindow):
         input_layout.addWidget(self.input_b)
         input_layout.addWidget(self.label_n)
         input_layout.addWidget(self.input_n)
+        input_layout.addWidget(self.combo_mc)
+        input_layout.addWidget(self.label_seed)
+        input_layout.addWidget(self.input_seed)
         input_layout.addWidget(self.btn_calc)
         input_layout.addWidget(self.btn_save)
 
+        stream_layout = QHBoxLayout()
+        stream_layout.addWidget(self.label_tol)
+        stream_layout.addWidget(self.input_tol)
+        stream_layout.addWidget(self.label_time)
+        stream_layout.addWidget(self.input_time)
+        stream_layout.addWidget(self.btn_stream)
+
         main_layout = QVBoxLayout()
         main_layout.addLayout(input_layout)
+        main_layout.addLayout(stream_layout)
         main_layout.addWidget(self.table)
         main_layout.addWidget(self.canvas)
 
@@ -100,31 +641,69 @@ class IntegralSolver(QMainWindow):
         a = float(self.input_a.text())
         b = float(self.input_b.text())
 
-        # значення N для обчислення
-        Ns = [10, 20, 50, 100, 1000]
-        self.table.setRowCount(len(Ns))
+        n0 = int(self.input_n.text())
+        if n0 < 1:
+            self.status_bar.showMessage("N має бути додатним!")
+            return
+
+        # порожнє зерно — щоразу нова випадкова послідовність
+        seed_text = self.input_seed.text().strip()
+        seed = int(seed_text) if seed_text else None
+
+        # N, 2N, 4N, ... на вкладених сітках
+        rows = romberg(a, b, n0, levels=5)
+        self.table.setRowCount(len(rows))
 
         results = []
-        for i, n in enumerate(Ns):
-            rect = rectangle_method(a, b, n)
-            trap = trapezoid_method(a, b, n)
-            monte = monte_carlo_method(a, b, n)
+        for i, (n, rect, trap, romb, err) in enumerate(rows):
+            gauss = gauss_legendre_method(a, b, n)
+            monte, monte_se = monte_carlo_method(a, b, n, self.combo_mc.currentData(), seed=seed)
             self.table.setItem(i, 0, QTableWidgetItem(str(n)))
             self.table.setItem(i, 1, QTableWidgetItem(f"{rect:.6f}"))
             self.table.setItem(i, 2, QTableWidgetItem(f"{trap:.6f}"))
-            self.table.setItem(i, 3, QTableWidgetItem(f"{monte:.6f}"))
-            results.append((n, rect, trap, monte))
+            self.table.setItem(i, 3, QTableWidgetItem(f"{romb:.10f}"))
+            self.table.setItem(i, 4, QTableWidgetItem(f"{err:.2e}"))
+            self.table.setItem(i, 5, QTableWidgetItem(f"{gauss:.10f}"))
+            self.table.setItem(i, 6, QTableWidgetItem(f"{monte:.6f} ± {monte_se:.1e}"))
+            results.append((n, rect, trap, romb, err, gauss, monte, monte_se))
 
         self.results = results
         self.plot_function(a, b)
-        self.status_bar.showMessage("Обчислення завершено!")
+        gk, gk_err, gk_evals = gauss_kronrod(a, b)
+        self.gk = (gk, gk_err, gk_evals)
+        ts, ts_err, ts_evals = tanh_sinh(a, b)
+        self.ts = (ts, ts_err, ts_evals)
+        self.status_bar.showMessage(
+            f"Обчислення завершено! Гаусс–Кронрод: {gk:.12f} (похибка ≈ {gk_err:.1e}, обчислень f: {gk_evals}); "
+            f"tanh-sinh: {ts:.12f} (похибка ≈ {ts_err:.1e}, обчислень f: {ts_evals})"
+        )
+
+    def run_stream(self):
+        a = float(self.input_a.text())
+        b = float(self.input_b.text())
+        tol = float(self.input_tol.text())
+        time_limit = float(self.input_time.text())
+        seed_text = self.input_seed.text().strip()
+        seed = int(seed_text) if seed_text else None
+
+        for value, se, count in monte_carlo_stream(a, b, tol, time_limit, seed=seed):
+            self.status_bar.showMessage(f"Монте-Карло: {value:.8f} ± {1.96 * se:.1e} (точок: {count})")
+            QApplication.processEvents()
+
+        self.stream = (value, se, count)
+        done = "досягнуто" if 1.96 * se <= tol else "не досягнуто за ліміт часу"
+        self.status_bar.showMessage(
+            f"Монте-Карло: {value:.8f} ± {1.96 * se:.1e} (точок: {count}), точність {done}"
+        )
 
     def plot_function(self, a, b):
         self.figure.clear()
         ax = self.figure.add_subplot(111)
         x_vals = np.linspace(a, b, 400)
-        y_vals = [f(x) for x in x_vals]
+        y_vals = eval_f(f, x_vals)
         ax.plot(x_vals, y_vals, color="blue", label="f(x) = 1 / √(12x² + 0.5)")
+        x_cum, F_vals, _ = cumulative_integral(a, b, 399)
+        ax.plot(x_cum, F_vals, color="green", linestyle="--", label="F(x) = ∫ₐˣ f(t) dt")
         ax.set_title(f"Графік функції на [{a}, {b}]")
         ax.legend()
         self.canvas.draw()
@@ -135,9 +714,16 @@ class IntegralSolver(QMainWindow):
             with open(filename, "w") as file:
                 file.write("Результати чисельного інтегрування:\n")
                 file.write("f(x) = 1 / √(12x² + 0.5)\n\n")
-                file.write("N\tПрямокутники\tТрапеції\tМонте-Карло\n")
-                for n, rect, trap, monte in self.results:
-                    file.write(f"{n}\t{rect:.6f}\t{trap:.6f}\t{monte:.6f}\n")
+                file.write(f"N\tПрямокутники\tТрапеції\tРомберг\tПохибка\tГаусс–Лежандр\tМонте-Карло ({self.combo_mc.currentText()})\n")
+                for n, rect, trap, romb, err, gauss, monte, monte_se in self.results:
+                    file.write(f"{n}\t{rect:.6f}\t{trap:.6f}\t{romb:.10f}\t{err:.2e}\t{gauss:.10f}\t{monte:.6f} ± {monte_se:.1e}\n")
+                gk, gk_err, gk_evals = self.gk
+                file.write(f"\nГаусс–Кронрод: {gk:.12f} (похибка ≈ {gk_err:.1e}, обчислень f: {gk_evals})\n")
+                ts, ts_err, ts_evals = self.ts
+                file.write(f"tanh-sinh: {ts:.12f} (похибка ≈ {ts_err:.1e}, обчислень f: {ts_evals})\n")
+                if self.stream is not None:
+                    value, se, count = self.stream
+                    file.write(f"Монте-Карло до точності: {value:.8f} ± {1.96 * se:.1e} (точок: {count})\n")
             self.status_bar.showMessage("Результати збережено.")
 
 
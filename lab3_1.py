@@ -1,4 +1,6 @@
 import sys
+import itertools
+from collections import deque
 import numpy as np
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QLabel, QLineEdit,
@@ -10,6 +12,264 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
 
+# достатні статистики лінійної регресії: кількість точок, середні x і y та
+# центровані суми Sxx, Syy, Sxy. порції додаються по одній, а накопичувачі з
+# різних процесів об'єднуються точно (попарна формула Чана)
+class RegressionStats:
+    def __init__(self):
+        self.n = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.sxx = 0.0
+        self.syy = 0.0
+        self.sxy = 0.0
+
+    # додати порцію точок
+    def update(self, x, y):
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if x.size == 0:
+            return self
+        part = RegressionStats()
+        part.n = x.size
+        part.mean_x = x.mean()
+        part.mean_y = y.mean()
+        dx = x - part.mean_x
+        dy = y - part.mean_y
+        part.sxx = np.dot(dx, dx)
+        part.syy = np.dot(dy, dy)
+        part.sxy = np.dot(dx, dy)
+        return self.merge(part)
+
+    # об'єднати з іншим накопичувачем
+    def merge(self, other):
+        n = self.n + other.n
+        if other.n == 0:
+            return self
+        dx = other.mean_x - self.mean_x
+        dy = other.mean_y - self.mean_y
+        w = self.n * other.n / n
+        self.sxx += other.sxx + dx * dx * w
+        self.syy += other.syy + dy * dy * w
+        self.sxy += other.sxy + dx * dy * w
+        self.mean_x += dx * other.n / n
+        self.mean_y += dy * other.n / n
+        self.n = n
+        return self
+
+    # коефіцієнти y = a·x + b і R²
+    def fit(self):
+        a = self.sxy / self.sxx
+        b = self.mean_y - a * self.mean_x
+        r2 = self.sxy * self.sxy / (self.sxx * self.syy)
+        return a, b, r2
+
+
+# регресія за ковзним вікном з останніх window точок: кожна нова точка додається,
+# а найстаріша вилучається за O(1) (оновлення Велфорда і обернене до нього).
+# середні зберігаються відносно початку відліку (ox, oy) — середнього вікна на момент
+# останнього перерахунку; раз на window кроків статистики перераховуються з вікна,
+# щоб не накопичувати похибку
+class RollingRegression(RegressionStats):
+    def __init__(self, window):
+        super().__init__()
+        self.window = window
+        self.points = deque()
+        self.steps = 0
+        self.ox = None
+        self.oy = None
+
+    # додати точку (x, y), за повного вікна — вилучивши найстарішу
+    def add(self, x, y):
+        if self.ox is None:
+            self.ox, self.oy = x, y
+        if len(self.points) == self.window:
+            self.remove()
+        self.points.append((x, y))
+        x -= self.ox
+        y -= self.oy
+        self.n += 1
+        dx = x - self.mean_x
+        dy = y - self.mean_y
+        self.mean_x += dx / self.n
+        self.mean_y += dy / self.n
+        self.sxx += dx * (x - self.mean_x)
+        self.syy += dy * (y - self.mean_y)
+        self.sxy += dx * (y - self.mean_y)
+        self.steps += 1
+        if self.steps % self.window == 0:
+            self.refresh()
+        return self
+
+    # вилучити найстарішу точку
+    def remove(self):
+        x, y = self.points.popleft()
+        x -= self.ox
+        y -= self.oy
+        self.n -= 1
+        if self.n == 0:
+            RegressionStats.__init__(self)
+            return self
+        dx = x - self.mean_x
+        dy = y - self.mean_y
+        self.mean_x -= dx / self.n
+        self.mean_y -= dy / self.n
+        self.sxx -= dx * (x - self.mean_x)
+        self.syy -= dy * (y - self.mean_y)
+        self.sxy -= dx * (y - self.mean_y)
+        return self
+
+    # точний перерахунок статистик з точок вікна з новим початком відліку
+    def refresh(self):
+        x, y = np.array(self.points).T
+        self.ox, self.oy = x.mean(), y.mean()
+        RegressionStats.__init__(self)
+        self.update(x - self.ox, y - self.oy)
+
+    # коефіцієнти y = a·x + b і R² за поточним вікном
+    def fit(self):
+        a, b, r2 = super().fit()
+        return a, self.oy + b - a * self.ox, r2
+
+
+# центровані моменти всіх вікон [i, i + window) ряду за O(N): ряд ділиться на блоки
+# довжиною window, кожне вікно — це суфікс одного блоку і префікс наступного, а
+# префіксні/суфіксні суми рахуються відносно середнього свого блоку й об'єднуються
+# формулою Чана. повертає масиви mean_x, mean_y, sxx, syy, sxy довжиною N - window + 1
+def rolling_moments(x, y, window):
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n, w = x.size, window
+    if n < w:
+        empty = np.empty(0)
+        return empty, empty, empty, empty, empty
+    blocks = -(-n // w)
+    pad = blocks * w - n
+    # доповнення останнім значенням; у жодне вікно воно не потрапляє
+    xb = np.pad(x, (0, pad), mode="edge").reshape(blocks, w)
+    yb = np.pad(y, (0, pad), mode="edge").reshape(blocks, w)
+    cx = xb.mean(axis=1, keepdims=True)
+    cy = yb.mean(axis=1, keepdims=True)
+    dx = xb - cx
+    dy = yb - cy
+    terms = np.stack([dx, dy, dx * dx, dy * dy, dx * dy])  # (5, blocks, w)
+    prefix = np.cumsum(terms, axis=2)
+    suffix = np.cumsum(terms[:, :, ::-1], axis=2)[:, :, ::-1]
+
+    i = np.arange(n - w + 1)
+    k, r = np.divmod(i, w)
+    # частина A: суфікс блоку k від позиції r
+    na = (w - r).astype(float)
+    sa = suffix[:, k, r]
+    # частина B: префікс блоку k + 1 довжиною r
+    nb = r.astype(float)
+    kb = np.minimum(k + 1, blocks - 1)
+    sb = np.where(r > 0, prefix[:, kb, np.maximum(r - 1, 0)], 0.0)
+
+    # середні частини відносно середнього її блоку та центровані суми
+    def moments(s, m):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mx = np.where(m > 0, s[0] / m, 0.0)
+            my = np.where(m > 0, s[1] / m, 0.0)
+        return mx, my, s[2] - m * mx * mx, s[3] - m * my * my, s[4] - m * mx * my
+
+    ax, ay, axx, ayy, axy = moments(sa, na)
+    bx, by, bxx, byy, bxy = moments(sb, nb)
+    # різниця середніх частин; різниця середніх блоків віднімається окремо, без втрати точності
+    ddx = np.where(nb > 0, (cx[kb, 0] - cx[k, 0]) + (bx - ax), 0.0)
+    ddy = np.where(nb > 0, (cy[kb, 0] - cy[k, 0]) + (by - ay), 0.0)
+    f = na * nb / w
+    return (cx[k, 0] + (ax + ddx * nb / w), cy[k, 0] + (ay + ddy * nb / w),
+            axx + bxx + ddx * ddx * f, ayy + byy + ddy * ddy * f, axy + bxy + ddx * ddy * f)
+
+
+# лінійна регресія за кожним вікном [i, i + window) ряду: масиви a, b, R²
+def rolling_fit(x, y, window):
+    mean_x, mean_y, sxx, syy, sxy = rolling_moments(x, y, window)
+    a = sxy / sxx
+    return a, mean_y - a * mean_x, sxy * sxy / (sxx * syy)
+
+
+# суми по кожному ряду: уздовж останньої осі 2-D масиву або, якщо ряди записані
+# підряд в одному масиві, по відрізках [offsets[i], offsets[i + 1])
+def series_sum(v, offsets=None):
+    if offsets is None:
+        return v.sum(axis=-1)
+    return np.add.reduceat(v, offsets)
+
+
+# значення кожного ряду, розгорнуті на всі його точки
+def series_expand(v, offsets=None, size=None):
+    if offsets is None:
+        return v[..., None]
+    return np.repeat(v, np.diff(np.append(offsets, size)))
+
+
+# кількість точок у кожному ряді (ряди мають бути непорожніми, offsets[0] = 0)
+def series_counts(y, offsets=None):
+    if offsets is None:
+        return y.shape[-1]
+    offsets = np.asarray(offsets)
+    counts = np.diff(np.append(offsets, y.size))
+    if offsets[0] != 0 or np.any(counts <= 0):
+        raise ValueError("offsets мають починатися з 0 і зростати строго")
+    return counts
+
+
+# лінійна регресія y = a·x + b для багатьох незалежних рядів одночасно:
+# x, y — 2-D масиви (ряд на рядок; x може бути спільним 1-D) або 1-D масиви
+# з рядами підряд і offsets — індексами їх початків. повертає масиви a, b, R²
+def batch_linear_fit(x, y, offsets=None):
+    y = np.asarray(y, dtype=float)
+    x = np.broadcast_to(np.asarray(x, dtype=float), y.shape)
+    counts = series_counts(y, offsets)
+    mean_x = series_sum(x, offsets) / counts
+    mean_y = series_sum(y, offsets) / counts
+    dx = x - series_expand(mean_x, offsets, y.size)
+    dy = y - series_expand(mean_y, offsets, y.size)
+    sxx = series_sum(dx * dx, offsets)
+    sxy = series_sum(dx * dy, offsets)
+    syy = series_sum(dy * dy, offsets)
+    a = sxy / sxx
+    b = mean_y - a * mean_x
+    return a, b, sxy * sxy / (sxx * syy)
+
+
+# читання пар (x, y) порціями по chunk рядків: .npy — масив (n, 2),
+# .bin — сирі float64 (x, y по черзі), інакше — текст CSV з двома стовпцями
+# (рядок заголовка пропускається)
+def read_chunks(path, chunk=1 << 20):
+    if path.endswith((".npy", ".bin")):
+        if path.endswith(".npy"):
+            data = np.load(path, mmap_mode="r")
+        else:
+            data = np.memmap(path, dtype=np.float64, mode="r").reshape(-1, 2)
+        for start in range(0, len(data), chunk):
+            block = np.asarray(data[start:start + chunk], dtype=float)
+            yield block[:, 0], block[:, 1]
+        return
+    with open(path) as file:
+        first = file.readline()
+        try:
+            [float(v) for v in first.split(",")[:2]]
+            head = [first]
+        except ValueError:
+            head = []
+        lines = head + list(itertools.islice(file, chunk - len(head)))
+        while lines:
+            block = np.loadtxt(lines, delimiter=",", usecols=(0, 1), ndmin=2)
+            yield block[:, 0], block[:, 1]
+            lines = list(itertools.islice(file, chunk))
+
+
+# регресія за файлом за один прохід зі сталою пам'яттю
+def fit_file(path, chunk=1 << 20):
+    stats = RegressionStats()
+    for x, y in read_chunks(path, chunk):
+        stats.update(x, y)
+    return stats
+
+
 class LinearRegressionApp(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -30,6 +290,9 @@ class LinearRegressionApp(QMainWindow):
         self.btn_calc = QPushButton("Обчислити регресію")
         self.btn_calc.clicked.connect(self.calculate_regression)
 
+        self.btn_load = QPushButton("Дані з файлу")
+        self.btn_load.clicked.connect(self.load_file)
+
         self.btn_save = QPushButton("Зберегти результати")
         self.btn_save.clicked.connect(self.save_results)
 
@@ -49,6 +312,7 @@ class LinearRegressionApp(QMainWindow):
         input_layout.addWidget(self.label_y)
         input_layout.addWidget(self.input_y)
         input_layout.addWidget(self.btn_calc)
+        input_layout.addWidget(self.btn_load)
         input_layout.addWidget(self.btn_save)
 
         main_layout = QVBoxLayout()
@@ -75,25 +339,50 @@ class LinearRegressionApp(QMainWindow):
             return
 
         # метод найменших квадратів
-        n = len(x_values)
-        a = (n * np.sum(x_values * y_values) - np.sum(x_values) * np.sum(y_values)) / \
-            (n * np.sum(x_values ** 2) - (np.sum(x_values)) ** 2)
-        b = (np.sum(y_values) - a * np.sum(x_values)) / n
+        a, b, r2 = RegressionStats().update(x_values, y_values).fit()
+        self.show_results(a, b, r2, len(x_values), x_values, y_values)
+
+    def load_file(self):
+        filename, _ = QFileDialog.getOpenFileName(
+            self, "Відкрити дані", "", "Data Files (*.csv *.txt *.npy *.bin)"
+        )
+        if not filename:
+            return
+
+        # один прохід зі сталою пам'яттю; для графіка — перші 1000 точок
+        stats = RegressionStats()
+        x_plot = y_plot = None
+        try:
+            for x, y in read_chunks(filename):
+                if x_plot is None:
+                    x_plot, y_plot = x[:1000].copy(), y[:1000].copy()
+                stats.update(x, y)
+                self.status_bar.showMessage(f"Прочитано точок: {stats.n}")
+                QApplication.processEvents()
+        except (OSError, ValueError) as e:
+            self.status_bar.showMessage(f"Помилка читання файлу: {e}")
+            return
+
+        if stats.n < 2:
+            self.status_bar.showMessage("Помилка: у файлі замало точок!")
+            return
+
+        a, b, r2 = stats.fit()
+        self.show_results(a, b, r2, stats.n, x_plot, y_plot)
 
-        # коефіцієнт детермінації R^2
+    def show_results(self, a, b, r2, n, x_values, y_values):
         y_pred = a * x_values + b
-        ss_res = np.sum((y_values - y_pred) ** 2)
-        ss_tot = np.sum((y_values - np.mean(y_values)) ** 2)
-        r2 = 1 - (ss_res / ss_tot)
 
         # оновити таблицю
-        self.table.setRowCount(3)
+        self.table.setRowCount(4)
         self.table.setItem(0, 0, QTableWidgetItem("Коефіцієнт a"))
         self.table.setItem(0, 1, QTableWidgetItem(f"{a:.6f}"))
         self.table.setItem(1, 0, QTableWidgetItem("Коефіцієнт b"))
         self.table.setItem(1, 1, QTableWidgetItem(f"{b:.6f}"))
         self.table.setItem(2, 0, QTableWidgetItem("R²"))
         self.table.setItem(2, 1, QTableWidgetItem(f"{r2:.6f}"))
+        self.table.setItem(3, 0, QTableWidgetItem("Кількість точок"))
+        self.table.setItem(3, 1, QTableWidgetItem(str(n)))
 
         # побудова графіка
         self.figure.clear()
@@ -107,7 +396,7 @@ class LinearRegressionApp(QMainWindow):
 
         self.status_bar.showMessage("Обчислення завершено!")
 
-        self.results = {"a": a, "b": b, "R2": r2}
+        self.results = {"a": a, "b": b, "R2": r2, "n": n}
 
     def save_results(self):
         if not hasattr(self, "results"):
@@ -121,6 +410,7 @@ class LinearRegressionApp(QMainWindow):
                 f.write(f"a = {self.results['a']:.6f}\n")
                 f.write(f"b = {self.results['b']:.6f}\n")
                 f.write(f"R² = {self.results['R2']:.6f}\n")
+                f.write(f"n = {self.results['n']}\n")
             self.status_bar.showMessage("Результати збережено.")
 
 
@@ -1,14 +1,332 @@
 import sys
+from collections import deque
 import numpy as np
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QLabel, QLineEdit,
     QPushButton, QVBoxLayout, QHBoxLayout, QTableWidget,
-    QTableWidgetItem, QFileDialog, QStatusBar
+    QTableWidgetItem, QFileDialog, QStatusBar, QComboBox
 )
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
 
+# Суми по кожному ряду: уздовж останньої осі 2-D масиву або, якщо ряди записані
+# підряд в одному масиві, по відрізках [offsets[i], offsets[i + 1])
+def series_sum(v, offsets=None):
+    if offsets is None:
+        return v.sum(axis=-1)
+    return np.add.reduceat(v, offsets)
+
+
+# Значення кожного ряду, розгорнуті на всі його точки
+def series_expand(v, offsets=None, size=None):
+    if offsets is None:
+        return v[..., None]
+    return np.repeat(v, np.diff(np.append(offsets, size)))
+
+
+# Кількість точок у кожному ряді (ряди мають бути непорожніми, offsets[0] = 0)
+def series_counts(y, offsets=None):
+    if offsets is None:
+        return y.shape[-1]
+    offsets = np.asarray(offsets)
+    counts = np.diff(np.append(offsets, y.size))
+    if offsets[0] != 0 or np.any(counts <= 0):
+        raise ValueError("offsets мають починатися з 0 і зростати строго")
+    return counts
+
+
+# Степенева регресія y = a * x^b для багатьох незалежних рядів одночасно
+# (ln(y) = ln(a) + b * ln(x)): x, y — 2-D масиви (ряд на рядок; x може бути
+# спільним 1-D) або 1-D масиви з рядами підряд і offsets — індексами їх початків.
+# Повертає масиви a, b і R² (у вихідних координатах, як у вікні програми)
+def batch_power_fit(x, y, offsets=None):
+    y = np.asarray(y, dtype=float)
+    x = np.broadcast_to(np.asarray(x, dtype=float), y.shape)
+    if np.any(x <= 0) or np.any(y <= 0):
+        raise ValueError("усі значення X та Y мають бути > 0 для логарифмування")
+    counts = series_counts(y, offsets)
+    X = np.log(x)
+    Y = np.log(y)
+    mean_X = series_sum(X, offsets) / counts
+    mean_Y = series_sum(Y, offsets) / counts
+    dX = X - series_expand(mean_X, offsets, y.size)
+    dY = Y - series_expand(mean_Y, offsets, y.size)
+    b = series_sum(dX * dY, offsets) / series_sum(dX * dX, offsets)
+    a = np.exp(mean_Y - b * mean_X)
+
+    # Коефіцієнт детермінації за прогнозом a * x^b
+    y_pred = series_expand(a, offsets, y.size) * x ** series_expand(b, offsets, y.size)
+    mean_y = series_sum(y, offsets) / counts
+    ss_res = series_sum((y - y_pred) ** 2, offsets)
+    ss_tot = series_sum((y - series_expand(mean_y, offsets, y.size)) ** 2, offsets)
+    return a, b, 1 - ss_res / ss_tot
+
+
+# Степенева регресія за ковзним вікном з останніх window точок з оновленням за O(1):
+# у логарифмах ln(y) = ln(a) + b * ln(x) додається нова точка і вилучається найстаріша
+# (оновлення Велфорда і обернене до нього). Середні зберігаються відносно початку
+# відліку — середнього вікна на момент останнього перерахунку, а раз на window кроків
+# статистики перераховуються з вікна. R² рахується в логарифмах: у вихідних
+# координатах він не оновлюється за O(1)
+class RollingPowerRegression:
+    def __init__(self, window):
+        self.window = window
+        self.points = deque()
+        self.steps = 0
+        self.ox = None
+        self.oy = None
+        self.reset()
+
+    def reset(self):
+        self.n = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.sxx = 0.0
+        self.syy = 0.0
+        self.sxy = 0.0
+
+    # Додати точку (x > 0, y > 0), за повного вікна — вилучивши найстарішу
+    def add(self, x, y):
+        if x <= 0 or y <= 0:
+            raise ValueError("X та Y мають бути > 0 для логарифмування")
+        X, Y = np.log(x), np.log(y)
+        if self.ox is None:
+            self.ox, self.oy = X, Y
+        if len(self.points) == self.window:
+            self.remove()
+        self.points.append((X, Y))
+        X -= self.ox
+        Y -= self.oy
+        self.n += 1
+        dx = X - self.mean_x
+        dy = Y - self.mean_y
+        self.mean_x += dx / self.n
+        self.mean_y += dy / self.n
+        self.sxx += dx * (X - self.mean_x)
+        self.syy += dy * (Y - self.mean_y)
+        self.sxy += dx * (Y - self.mean_y)
+        self.steps += 1
+        if self.steps % self.window == 0:
+            self.refresh()
+        return self
+
+    # Вилучити найстарішу точку
+    def remove(self):
+        X, Y = self.points.popleft()
+        X -= self.ox
+        Y -= self.oy
+        self.n -= 1
+        if self.n == 0:
+            self.reset()
+            return self
+        dx = X - self.mean_x
+        dy = Y - self.mean_y
+        self.mean_x -= dx / self.n
+        self.mean_y -= dy / self.n
+        self.sxx -= dx * (X - self.mean_x)
+        self.syy -= dy * (Y - self.mean_y)
+        self.sxy -= dx * (Y - self.mean_y)
+        return self
+
+    # Точний перерахунок статистик з точок вікна з новим початком відліку
+    def refresh(self):
+        X, Y = np.array(self.points).T
+        self.ox, self.oy = X.mean(), Y.mean()
+        dx = X - self.ox
+        dy = Y - self.oy
+        self.n = X.size
+        self.mean_x = dx.mean()
+        self.mean_y = dy.mean()
+        dx -= self.mean_x
+        dy -= self.mean_y
+        self.sxx = np.dot(dx, dx)
+        self.syy = np.dot(dy, dy)
+        self.sxy = np.dot(dx, dy)
+
+    # Коефіцієнти y = a * x^b і R² (у логарифмах) за поточним вікном
+    def fit(self):
+        b = self.sxy / self.sxx
+        a = np.exp(self.oy + self.mean_y - b * (self.ox + self.mean_x))
+        return a, b, self.sxy * self.sxy / (self.sxx * self.syy)
+
+
+# Центровані моменти всіх вікон [i, i + window) ряду за O(N): ряд ділиться на блоки
+# довжиною window, кожне вікно — це суфікс одного блоку і префікс наступного, а
+# префіксні/суфіксні суми рахуються відносно середнього свого блоку й об'єднуються
+# формулою Чана. Повертає масиви mean_x, mean_y, sxx, syy, sxy довжиною N - window + 1
+def rolling_moments(x, y, window):
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n, w = x.size, window
+    if n < w:
+        empty = np.empty(0)
+        return empty, empty, empty, empty, empty
+    blocks = -(-n // w)
+    pad = blocks * w - n
+    # Доповнення останнім значенням; у жодне вікно воно не потрапляє
+    xb = np.pad(x, (0, pad), mode="edge").reshape(blocks, w)
+    yb = np.pad(y, (0, pad), mode="edge").reshape(blocks, w)
+    cx = xb.mean(axis=1, keepdims=True)
+    cy = yb.mean(axis=1, keepdims=True)
+    dx = xb - cx
+    dy = yb - cy
+    terms = np.stack([dx, dy, dx * dx, dy * dy, dx * dy])  # (5, blocks, w)
+    prefix = np.cumsum(terms, axis=2)
+    suffix = np.cumsum(terms[:, :, ::-1], axis=2)[:, :, ::-1]
+
+    i = np.arange(n - w + 1)
+    k, r = np.divmod(i, w)
+    # Частина A: суфікс блоку k від позиції r
+    na = (w - r).astype(float)
+    sa = suffix[:, k, r]
+    # Частина B: префікс блоку k + 1 довжиною r
+    nb = r.astype(float)
+    kb = np.minimum(k + 1, blocks - 1)
+    sb = np.where(r > 0, prefix[:, kb, np.maximum(r - 1, 0)], 0.0)
+
+    # Середні частини відносно середнього її блоку та центровані суми
+    def moments(s, m):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mx = np.where(m > 0, s[0] / m, 0.0)
+            my = np.where(m > 0, s[1] / m, 0.0)
+        return mx, my, s[2] - m * mx * mx, s[3] - m * my * my, s[4] - m * mx * my
+
+    ax, ay, axx, ayy, axy = moments(sa, na)
+    bx, by, bxx, byy, bxy = moments(sb, nb)
+    # Різниця середніх частин; різниця середніх блоків віднімається окремо, без втрати точності
+    ddx = np.where(nb > 0, (cx[kb, 0] - cx[k, 0]) + (bx - ax), 0.0)
+    ddy = np.where(nb > 0, (cy[kb, 0] - cy[k, 0]) + (by - ay), 0.0)
+    f = na * nb / w
+    return (cx[k, 0] + (ax + ddx * nb / w), cy[k, 0] + (ay + ddy * nb / w),
+            axx + bxx + ddx * ddx * f, ayy + byy + ddy * ddy * f, axy + bxy + ddx * ddy * f)
+
+
+# Степенева регресія за кожним вікном [i, i + window) ряду: масиви a, b і R² (у логарифмах)
+def rolling_power_fit(x, y, window):
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if np.any(x <= 0) or np.any(y <= 0):
+        raise ValueError("усі значення X та Y мають бути > 0 для логарифмування")
+    mean_x, mean_y, sxx, syy, sxy = rolling_moments(np.log(x), np.log(y), window)
+    b = sxy / sxx
+    return np.exp(mean_y - b * mean_x), b, sxy * sxy / (sxx * syy)
+
+
+# Моделі для нелінійного МНК: значення та похідні за a і b (аналітичний якобіан)
+def power_model(x, a, b):
+    xb = x ** b
+    return a * xb, xb, a * xb * np.log(x)
+
+
+def exponential_model(x, a, b):
+    e = np.exp(b * x)
+    return a * e, e, a * x * e
+
+
+def logarithmic_model(x, a, b):
+    lx = np.log(x)
+    return a + b * lx, np.ones_like(lx), lx
+
+
+# Назва моделі -> (функція, підпис для графіка)
+MODELS = {
+    "power": (power_model, "y = {a:.2f} * x^{b:.2f}"),
+    "exponential": (exponential_model, "y = {a:.2f} * e^({b:.2f}x)"),
+    "logarithmic": (logarithmic_model, "y = {a:.2f} + {b:.2f} * ln(x)"),
+}
+
+
+# Початкове наближення для методу Левенберга–Марквардта: лінійна регресія
+# після логарифмування (для степеневої та експоненціальної — лише за точками з y > 0).
+# Якщо таких точок менше двох, береться стала a = середнє y, b = 0
+def lm_seed(x, y, model):
+    if model == "logarithmic":
+        X, Y, w = np.log(x), y, np.ones_like(y)
+    else:
+        X = np.log(x) if model == "power" else x
+        w = (y > 0).astype(float)
+        Y = np.log(np.where(y > 0, y, 1.0))
+    count = w.sum(axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_X = (w * X).sum(axis=-1) / count
+        mean_Y = (w * Y).sum(axis=-1) / count
+        dX = w * (X - mean_X[..., None])
+        slope = (dX * (Y - mean_Y[..., None])).sum(axis=-1) / (dX * dX).sum(axis=-1)
+    intercept = mean_Y - slope * mean_X
+    if model == "logarithmic":
+        return intercept, slope
+    ok = (count >= 2) & np.isfinite(slope)
+    return np.where(ok, np.exp(intercept), y.mean(axis=-1)), np.where(ok, slope, 0.0)
+
+
+# Нелінійний МНК y = model(x; a, b) у вихідних координатах методом Левенберга–Марквардта
+# з аналітичним якобіаном, стартуючи з лог-лінійного розв'язку (lm_seed).
+# x, y — 1-D масиви одного ряду або 2-D масиви (ряд на рядок; x може бути спільним 1-D),
+# кожен ряд має власний параметр загасання. Повертає a, b, R² і кількість ітерацій
+def lm_fit(x, y, model="power", eps=1e-12, max_iter=50):
+    func = MODELS[model][0]
+    y = np.asarray(y, dtype=float)
+    x = np.broadcast_to(np.asarray(x, dtype=float), y.shape)
+    if model != "exponential" and np.any(x <= 0):
+        raise ValueError("усі значення X мають бути > 0 для цієї моделі")
+    single = y.ndim == 1
+    if single:
+        x, y = x[None], y[None]
+
+    with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        a, b = lm_seed(x, y, model)
+        lam = np.full(a.shape, 1e-3)
+        f, ja, jb = func(x, a[:, None], b[:, None])
+        r = y - f
+        cost = (r * r).sum(axis=-1)
+        active = np.isfinite(cost)
+        iters = np.zeros(a.shape, dtype=int)
+        for _ in range(max_iter):
+            if not active.any():
+                break
+            # Розв'язок системи 2x2 (JᵀJ + λ·diag(JᵀJ)) δ = Jᵀr для всіх рядів одразу
+            A11 = (ja * ja).sum(axis=-1)
+            A12 = (ja * jb).sum(axis=-1)
+            A22 = (jb * jb).sum(axis=-1)
+            g1 = (ja * r).sum(axis=-1)
+            g2 = (jb * r).sum(axis=-1)
+            # Оптимум: градієнт |Jᵀr| не перевищує eps·‖J‖·‖r‖
+            active &= np.hypot(g1, g2) > eps * np.sqrt((A11 + A22) * cost)
+            D11 = A11 * (1 + lam)
+            D22 = A22 * (1 + lam)
+            det = D11 * D22 - A12 * A12
+            da = (g1 * D22 - g2 * A12) / det
+            db = (D11 * g2 - A12 * g1) / det
+
+            f_new, ja_new, jb_new = func(x, (a + da)[:, None], (b + db)[:, None])
+            r_new = y - f_new
+            cost_new = (r_new * r_new).sum(axis=-1)
+            better = active & (cost_new < cost)
+            small = (np.abs(da) <= eps * (np.abs(a) + eps)) & (np.abs(db) <= eps * (np.abs(b) + eps))
+            # Відхилений крок теж означає збіжність, якщо він уже не змінює a і b або
+            # передбачене лінійною моделлю зменшення δᵀJᵀr не перевищує eps·cost
+            tiny = np.where(better, cost - cost_new, da * g1 + db * g2) <= eps * cost
+            converged = active & (small | tiny)
+
+            a = np.where(better, a + da, a)
+            b = np.where(better, b + db, b)
+            m = better[:, None]
+            f, ja, jb, r = (np.where(m, new, old) for new, old in
+                            ((f_new, f), (ja_new, ja), (jb_new, jb), (r_new, r)))
+            cost = np.where(better, cost_new, cost)
+            lam = np.where(better, lam / 10, lam * 10)
+            iters += active
+            # Зупинка: малий крок або спад суми квадратів, або λ зросла так, що крок не зменшує її
+            active &= ~converged & (lam < 1e16) & np.isfinite(det)
+
+    ss_tot = ((y - y.mean(axis=-1, keepdims=True)) ** 2).sum(axis=-1)
+    r2 = 1 - cost / ss_tot
+    if single:
+        return a[0], b[0], r2[0], int(iters[0])
+    return a, b, r2, iters
+
+
 class PowerRegressionApp(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -32,6 +350,13 @@ class PowerRegressionApp(QMainWindow):
         self.btn_save = QPushButton("Зберегти результати")
         self.btn_save.clicked.connect(self.save_results)
 
+        # режим: лог-лінійна регресія або нелінійний МНК у вихідних координатах
+        self.combo_mode = QComboBox()
+        self.combo_mode.addItem("ln y = ln a + b ln x", "log")
+        self.combo_mode.addItem("МНК: y = a * x^b", "power")
+        self.combo_mode.addItem("МНК: y = a * e^(bx)", "exponential")
+        self.combo_mode.addItem("МНК: y = a + b * ln(x)", "logarithmic")
+
         # таблиця результатів
         self.table = QTableWidget()
         self.table.setColumnCount(2)
@@ -47,6 +372,7 @@ class PowerRegressionApp(QMainWindow):
         input_layout.addWidget(self.input_x)
         input_layout.addWidget(self.label_y)
         input_layout.addWidget(self.input_y)
+        input_layout.addWidget(self.combo_mode)
         input_layout.addWidget(self.btn_calc)
         input_layout.addWidget(self.btn_save)
 
@@ -73,24 +399,25 @@ class PowerRegressionApp(QMainWindow):
             self.status_bar.showMessage("Помилка: кількість X і Y має співпадати!")
             return
 
-        if np.any(x_values <= 0) or np.any(y_values <= 0):
-            self.status_bar.showMessage("Помилка: усі значення X та Y мають бути > 0 для логарифмування!")
-            return
-
-        # Лінійне перетворення: ln(y) = ln(a) + b * ln(x)
-        X = np.log(x_values)
-        Y = np.log(y_values)
+        mode = self.combo_mode.currentData()
+        if mode == "log":
+            if np.any(x_values <= 0) or np.any(y_values <= 0):
+                self.status_bar.showMessage("Помилка: усі значення X та Y мають бути > 0 для логарифмування!")
+                return
 
-        n = len(X)
-        b = (n * np.sum(X * Y) - np.sum(X) * np.sum(Y)) / (n * np.sum(X ** 2) - (np.sum(X)) ** 2)
-        A = (np.sum(Y) - b * np.sum(X)) / n
-        a = np.exp(A)
+            # Лінійне перетворення: ln(y) = ln(a) + b * ln(x)
+            a, b, r2 = batch_power_fit(x_values, y_values)
+            func, label = MODELS["power"]
+            message = "Обчислення завершено!"
+        else:
+            if mode != "exponential" and np.any(x_values <= 0):
+                self.status_bar.showMessage("Помилка: усі значення X мають бути > 0 для цієї моделі!")
+                return
 
-        # Обчислення прогнозних значень і коефіцієнта детермінації
-        y_pred = a * x_values ** b
-        ss_res = np.sum((y_values - y_pred) ** 2)
-        ss_tot = np.sum((y_values - np.mean(y_values)) ** 2)
-        r2 = 1 - (ss_res / ss_tot)
+            # Левенберг–Марквардт у вихідних координатах, старт — лог-лінійний розв'язок
+            a, b, r2, iters = lm_fit(x_values, y_values, mode)
+            func, label = MODELS[mode]
+            message = f"Обчислення завершено! Ітерацій Левенберга–Марквардта: {iters}"
 
         # Оновлення таблиці
         self.table.setRowCount(3)
@@ -105,14 +432,15 @@ class PowerRegressionApp(QMainWindow):
         self.figure.clear()
         ax = self.figure.add_subplot(111)
         ax.scatter(x_values, y_values, color="blue", label="Експериментальні точки")
-        ax.plot(x_values, y_pred, color="red", label=f"y = {a:.2f} * x^{b:.2f}")
-        ax.set_title("Степенева регресія y = a * x^b")
+        x_line = np.linspace(x_values.min(), x_values.max(), 200)
+        ax.plot(x_line, func(x_line, a, b)[0], color="red", label=label.format(a=a, b=b))
+        ax.set_title(f"Регресія: {self.combo_mode.currentText()}")
         ax.legend()
         ax.grid(True)
         self.canvas.draw()
 
-        self.status_bar.showMessage("Обчислення завершено!")
-        self.results = {"a": a, "b": b, "R2": r2}
+        self.status_bar.showMessage(message)
+        self.results = {"a": a, "b": b, "R2": r2, "model": self.combo_mode.currentText()}
 
     def save_results(self):
         if not hasattr(self, "results"):
@@ -122,7 +450,7 @@ class PowerRegressionApp(QMainWindow):
         filename, _ = QFileDialog.getSaveFileName(self, "Зберегти результати", "", "Text Files (*.txt)")
         if filename:
             with open(filename, "w") as f:
-                f.write("Результати степеневої регресії y = a * x^b\n\n")
+                f.write(f"Результати регресії: {self.results['model']}\n\n")
                 f.write(f"a = {self.results['a']:.6f}\n")
                 f.write(f"b = {self.results['b']:.6f}\n")
                 f.write(f"R² = {self.results['R2']:.6f}\n")
@@ -0,0 +1,265 @@
+import sys
+import numpy as np
+from PyQt6.QtWidgets import (
+    QApplication, QMainWindow, QWidget, QLabel, QLineEdit,
+    QPushButton, QVBoxLayout, QHBoxLayout, QTableWidget,
+    QTableWidgetItem, QFileDialog, QStatusBar
+)
+from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.figure import Figure
+
+
+# розмір порції точок за один прохід
+CHUNK = 1 << 20
+
+
+# спільні моменти для всіх моделей: матриця M = ΦᵀΦ ознак
+# Φ = [1, t, t², ..., t^k, ln x, ln y, y - cy], де t = (x - c) / s — масштабований x,
+# cy — орієнтовне середнє y. кожна модель — це лінійна регресія одного стовпця
+# на кілька інших, тож усі моделі обчислюються з однієї матриці. порції
+# (і накопичувачі) додаються
+class SharedMoments:
+    def __init__(self, degree, c=0.0, s=1.0, cy=0.0):
+        self.degree = degree
+        self.c = c
+        self.s = s
+        self.cy = cy
+        self.n = 0
+        self.M = np.zeros((degree + 4, degree + 4))
+        self.min_x = np.inf
+        self.min_y = np.inf
+
+    # номери стовпців ln x, ln y, y
+    @property
+    def cols(self):
+        k = self.degree
+        return k + 1, k + 2, k + 3
+
+    # додати порцію точок
+    def update(self, x, y):
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        t = (x - self.c) / self.s
+        phi = np.empty((x.size, self.degree + 4))
+        phi[:, :self.degree + 1] = t[:, None] ** np.arange(self.degree + 1)
+        # логарифми лише для додатних значень; інакше модель не використовується
+        phi[:, self.degree + 1] = np.log(np.where(x > 0, x, 1.0))
+        phi[:, self.degree + 2] = np.log(np.where(y > 0, y, 1.0))
+        phi[:, self.degree + 3] = y - self.cy
+        self.M += phi.T @ phi
+        self.n += x.size
+        self.min_x = min(self.min_x, x.min(initial=np.inf))
+        self.min_y = min(self.min_y, y.min(initial=np.inf))
+        return self
+
+    # об'єднати з іншим накопичувачем (з тими самими degree, c, s)
+    def merge(self, other):
+        self.M += other.M
+        self.n += other.n
+        self.min_x = min(self.min_x, other.min_x)
+        self.min_y = min(self.min_y, other.min_y)
+        return self
+
+    # коефіцієнти регресії стовпця target на стовпці regressors
+    def solve(self, regressors, target):
+        return np.linalg.solve(self.M[np.ix_(regressors, regressors)], self.M[regressors, target])
+
+    # усі моделі, що підходять до даних: список (назва, формула, функція прогнозу, кількість параметрів)
+    def fit_models(self):
+        c, s, k, cy = self.c, self.s, self.degree, self.cy
+        lx, ly, y = self.cols
+        models = []
+
+        b0, b1 = self.solve([0, 1], y)
+        a, b = b1 / s, b0 + cy - b1 * c / s
+        models.append(("Лінійна", f"y = {a:.4f}x + {b:.4f}", lambda x, a=a, b=b: a * x + b, 2))
+
+        if self.min_x > 0 and self.min_y > 0:
+            b0, b1 = self.solve([0, lx], ly)
+            a, b = np.exp(b0), b1
+            models.append(("Степенева", f"y = {a:.4f} * x^{b:.4f}", lambda x, a=a, b=b: a * x ** b, 2))
+
+        if self.min_y > 0:
+            b0, b1 = self.solve([0, 1], ly)
+            a, b = np.exp(b0 - b1 * c / s), b1 / s
+            models.append(("Експоненціальна", f"y = {a:.4f} * e^({b:.4f}x)",
+                           lambda x, a=a, b=b: a * np.exp(b * x), 2))
+
+        if self.min_x > 0:
+            a, b = self.solve([0, lx], y)
+            a += cy
+            models.append(("Логарифмічна", f"y = {a:.4f} + {b:.4f} * ln(x)",
+                           lambda x, a=a, b=b: a + b * np.log(x), 2))
+
+        # степінь не більше n - 2: інакше поліном проходить через усі точки,
+        # SSE = 0 і AIC штучно найменший
+        for d in range(2, min(k, self.n - 2) + 1):
+            beta = self.solve(list(range(d + 1)), y)
+            beta[0] += cy
+            # перехід від t = (x - c) / s до x
+            p = np.polynomial.Polynomial(beta)(np.polynomial.Polynomial([-c / s, 1 / s]))
+            terms = " + ".join(f"{coef:.4f}x^{j}" if j > 1 else (f"{coef:.4f}x" if j else f"{coef:.4f}")
+                               for j, coef in reversed(list(enumerate(p.coef))))
+            models.append((f"Поліном {d}-го степеня", f"y = {terms}", p, d + 1))
+
+        return models
+
+
+# вибір моделі: перший прохід — спільні моменти і всі моделі одразу, другий —
+# суми квадратів залишків усіх моделей у вихідних координатах y. SSE не
+# береться з матриці моментів як y'y - βᵀXᵀy: при добрій підгонці різниця
+# великих чисел губить залишок в округленні. повертає список
+# (назва, формула, функція прогнозу, R², AIC), упорядкований за AIC
+def select_models(x, y, degree=3):
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    head = x[:CHUNK]
+    c = head.mean()
+    s = max(np.abs(head - c).max(), 1e-300)
+    moments = SharedMoments(degree, c, s, y[:CHUNK].mean())
+    for start in range(0, x.size, CHUNK):
+        moments.update(x[start:start + CHUNK], y[start:start + CHUNK])
+    models = moments.fit_models()
+
+    mean_y = moments.M[0, moments.cols[2]] / moments.n + moments.cy
+    sse = np.zeros(len(models))
+    sst = 0.0
+    for start in range(0, x.size, CHUNK):
+        xc, yc = x[start:start + CHUNK], y[start:start + CHUNK]
+        sst += np.sum((yc - mean_y) ** 2)
+        for i, (_, _, predict, _) in enumerate(models):
+            sse[i] += np.sum((yc - predict(xc)) ** 2)
+
+    n = moments.n
+    ranked = []
+    for (name, formula, predict, p), e in zip(models, sse):
+        r2 = 1 - e / sst
+        aic = n * np.log(max(e, 1e-300) / n) + 2 * p
+        ranked.append((name, formula, predict, r2, aic))
+    ranked.sort(key=lambda m: m[4])
+    return ranked
+
+
+class ModelSelectionApp(QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("Вибір моделі регресії за R² та AIC")
+        self.setFixedSize(900, 650)
+        self.initUI()
+
+    def initUI(self):
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+
+        # поля вводу
+        self.label_x = QLabel("X:")
+        self.input_x = QLineEdit("1, 2, 3, 4, 5, 6, 7, 8")
+        self.label_y = QLabel("Y:")
+        self.input_y = QLineEdit("56.9, 67.3, 81.6, 201, 240, 474, 490, 518")
+        self.label_k = QLabel("Степінь полінома:")
+        self.input_k = QLineEdit("3")
+
+        self.btn_calc = QPushButton("Підібрати моделі")
+        self.btn_calc.clicked.connect(self.calculate_models)
+
+        self.btn_save = QPushButton("Зберегти результати")
+        self.btn_save.clicked.connect(self.save_results)
+
+        # таблиця результатів
+        self.table = QTableWidget()
+        self.table.setColumnCount(4)
+        self.table.setHorizontalHeaderLabels(["Модель", "Формула", "R²", "AIC"])
+
+        # поле для графіка
+        self.figure = Figure(figsize=(5, 3))
+        self.canvas = FigureCanvas(self.figure)
+
+        # розташування елементів
+        input_layout = QHBoxLayout()
+        input_layout.addWidget(self.label_x)
+        input_layout.addWidget(self.input_x)
+        input_layout.addWidget(self.label_y)
+        input_layout.addWidget(self.input_y)
+        input_layout.addWidget(self.label_k)
+        input_layout.addWidget(self.input_k)
+        input_layout.addWidget(self.btn_calc)
+        input_layout.addWidget(self.btn_save)
+
+        main_layout = QVBoxLayout()
+        main_layout.addLayout(input_layout)
+        main_layout.addWidget(self.table)
+        main_layout.addWidget(self.canvas)
+
+        central_widget.setLayout(main_layout)
+
+        # рядок стану
+        self.status_bar = QStatusBar()
+        self.setStatusBar(self.status_bar)
+
+    def calculate_models(self):
+        try:
+            x_values = np.array([float(i.strip()) for i in self.input_x.text().split(",")])
+            y_values = np.array([float(i.strip()) for i in self.input_y.text().split(",")])
+            degree = int(self.input_k.text())
+        except ValueError:
+            self.status_bar.showMessage("Помилка: введіть числа через кому і цілий степінь!")
+            return
+
+        if len(x_values) != len(y_values):
+            self.status_bar.showMessage("Помилка: кількість X і Y має співпадати!")
+            return
+
+        if len(x_values) < 3 or degree < 1:
+            self.status_bar.showMessage("Помилка: потрібно щонайменше 3 точки і степінь ≥ 1!")
+            return
+
+        ranked = select_models(x_values, y_values, degree)
+
+        # оновити таблицю (найкраща модель — перша)
+        self.table.setRowCount(len(ranked))
+        for i, (name, formula, _, r2, aic) in enumerate(ranked):
+            self.table.setItem(i, 0, QTableWidgetItem(name))
+            self.table.setItem(i, 1, QTableWidgetItem(formula))
+            self.table.setItem(i, 2, QTableWidgetItem(f"{r2:.6f}"))
+            self.table.setItem(i, 3, QTableWidgetItem(f"{aic:.4f}"))
+        self.table.resizeColumnsToContents()
+
+        # побудова графіка
+        self.figure.clear()
+        ax = self.figure.add_subplot(111)
+        ax.scatter(x_values, y_values, color="blue", label="Експериментальні точки")
+        x_line = np.linspace(x_values.min(), x_values.max(), 200)
+        for i, (name, _, predict, _, _) in enumerate(ranked):
+            if i == 0:
+                ax.plot(x_line, predict(x_line), color="red", linewidth=2, label=f"{name} (найкраща)")
+            else:
+                ax.plot(x_line, predict(x_line), linestyle="--", linewidth=1, label=name)
+        ax.set_title("Порівняння моделей регресії")
+        ax.legend(fontsize=7)
+        ax.grid(True)
+        self.canvas.draw()
+
+        self.status_bar.showMessage(f"Обчислення завершено! Найкраща модель за AIC: {ranked[0][0]}")
+
+        self.results = [(name, formula, r2, aic) for name, formula, _, r2, aic in ranked]
+
+    def save_results(self):
+        if not hasattr(self, "results"):
+            self.status_bar.showMessage("Спочатку виконайте обчислення!")
+            return
+
+        filename, _ = QFileDialog.getSaveFileName(self, "Зберегти результати", "", "Text Files (*.txt)")
+        if filename:
+            with open(filename, "w") as f:
+                f.write("Вибір моделі регресії (упорядковано за AIC)\n\n")
+                f.write("Модель\tФормула\tR²\tAIC\n")
+                for name, formula, r2, aic in self.results:
+                    f.write(f"{name}\t{formula}\t{r2:.6f}\t{aic:.4f}\n")
+            self.status_bar.showMessage("Результати збережено.")
+
+
+if __name__ == "__main__":
+    app = QApplication(sys.argv)
+    window = ModelSelectionApp()
+    window.show()
+    sys.exit(app.exec())